@@ -18,5 +18,30 @@
 #
 # You should have received a copy of the GNU General Public License
 
+from . import instrumentation
+from .coordinates import *
 from .date_profile import *
+from .ephemeris import *
+from .kernels import *
 from .location import *
+from .location_set import *
+from .night_boundaries import *
+from .night_cache import *
+from .night_store import *
+from .nights import *
+from .parallel import *
+from .shared_profile import *
+from .sidereal import *
+from .time_scales import *
+from .timeline import *
+
+
+def __getattr__(name):
+    # AsyncDateClock is imported on first use, since asyncio is slow to
+    # import and only needed by the asyncio applications. It is therefore
+    # not part of the star import, and documented from its clock module.
+    if name == "AsyncDateClock":
+        from .clock import AsyncDateClock
+
+        return AsyncDateClock
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,169 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import asyncio
+import time
+
+from .date_profile import DateProfile
+
+__all__ = ["AsyncDateClock"]
+
+
+class AsyncDateClock(object):
+    """This class keeps the current date information up to date in an
+    asyncio event loop.
+
+    A single `DateProfile` is updated at a fixed rate, and each tick is
+    published as a `DateSnapshot`. Readers either get the most recent one
+    from `latest`, a plain attribute read, or wait for the next ones on a
+    queue from `subscribe`.
+
+    Parameters
+    ----------
+    location : `lsst.ts.dateloc.ObservatoryLocation`
+        The location site information instance.
+    interval : `float`, optional
+        The time (seconds) between ticks.
+    time_func : `callable`, optional
+        The function giving the current UTC timestamp.
+    legacy_mjd : `bool`, optional
+        The MJD calculation of the underlying `DateProfile`.
+    """
+
+    def __init__(self, location, interval=1.0, time_func=time.time, legacy_mjd=False):
+        self.interval = interval
+        self.time_func = time_func
+        self._date_profile = DateProfile(time_func(), location, legacy_mjd=legacy_mjd)
+        self._latest = self._date_profile.snapshot()
+        self._queues = []
+        self._task = None
+
+    @property
+    def latest(self):
+        """The most recent date information.
+
+        Returns
+        -------
+        `lsst.ts.dateloc.DateSnapshot`
+            The timestamp, MJD, LST and midnights of the last tick.
+        """
+        return self._latest
+
+    @property
+    def running(self):
+        """True if the clock is ticking.
+
+        Returns
+        -------
+        `bool`
+            True if the clock was started and not stopped.
+        """
+        return self._task is not None and not self._task.done()
+
+    def subscribe(self, maxsize=1):
+        """Get a queue receiving the date information of every tick.
+
+        When the queue is full the oldest value is dropped, so slow readers
+        always get the most recent values.
+
+        Parameters
+        ----------
+        maxsize : `int`, optional
+            The number of values kept in the queue.
+
+        Returns
+        -------
+        `asyncio.Queue`
+            The queue of `lsst.ts.dateloc.DateSnapshot`.
+        """
+        queue = asyncio.Queue(maxsize=maxsize)
+        self._queues.append(queue)
+        return queue
+
+    def unsubscribe(self, queue):
+        """Stop publishing to a queue.
+
+        Parameters
+        ----------
+        queue : `asyncio.Queue`
+            The queue given by `subscribe`.
+        """
+        self._queues.remove(queue)
+
+    def tick(self):
+        """Update the date information to the current time and publish it.
+
+        Returns
+        -------
+        `lsst.ts.dateloc.DateSnapshot`
+            The timestamp, MJD, LST and midnights of the tick.
+        """
+        self._date_profile.update(self.time_func())
+        snapshot = self._date_profile.snapshot()
+        self._latest = snapshot
+        for queue in self._queues:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(snapshot)
+        return snapshot
+
+    def start(self):
+        """Start ticking in the running event loop.
+
+        Calling it again while running does nothing.
+        """
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop ticking."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        """Tick at a fixed rate until cancelled.
+
+        The ticks are scheduled from the start time, so they do not drift
+        when a tick is late.
+        """
+        loop = asyncio.get_running_loop()
+        next_time = loop.time()
+        while True:
+            self.tick()
+            next_time += self.interval
+            delay = next_time - loop.time()
+            if delay < 0.0:
+                # Skip the missed ticks instead of running them back to back.
+                next_time += -delay // self.interval * self.interval + self.interval
+                delay = next_time - loop.time()
+            await asyncio.sleep(delay)
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.stop()
@@ -0,0 +1,88 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import math
+from collections import namedtuple
+
+import numpy as np
+
+__all__ = ["HorizontalCoordinates", "radec_to_altaz"]
+
+HorizontalCoordinates = namedtuple(
+    "HorizontalCoordinates",
+    ["hour_angle", "altitude", "azimuth", "parallactic_angle"],
+)
+HorizontalCoordinates.__doc__ = """Horizontal coordinates of sky positions.
+
+Parameters
+----------
+hour_angle : `numpy.ndarray`
+    Hour angle (radians) in the range [-pi, pi).
+altitude : `numpy.ndarray`
+    Altitude (radians).
+azimuth : `numpy.ndarray`
+    Azimuth (radians), from North through East, in the range [0, 2 pi).
+parallactic_angle : `numpy.ndarray`
+    Parallactic angle (radians).
+"""
+
+
+def radec_to_altaz(ra_rad, dec_rad, lst_rad, location):
+    """Convert equatorial coordinates to horizontal coordinates.
+
+    The inputs are broadcast against each other, so many fields can be
+    converted for many times in one call, e.g. by passing the LST with shape
+    (N, 1) and the coordinates with shape (M,). The conventions follow
+    `palpy.de2h` and `palpy.pa`.
+
+    Parameters
+    ----------
+    ra_rad : `numpy.ndarray` or `float`
+        Right ascension (radians).
+    dec_rad : `numpy.ndarray` or `float`
+        Declination (radians).
+    lst_rad : `numpy.ndarray` or `float`
+        Local Sidereal Time (radians).
+    location : `lsst.ts.dateloc.ObservatoryLocation`
+        The location site information instance.
+
+    Returns
+    -------
+    `HorizontalCoordinates`
+        The hour angle, altitude, azimuth and parallactic angle (radians).
+    """
+    hour_angle = np.subtract(lst_rad, ra_rad)
+    hour_angle = np.mod(hour_angle + math.pi, 2.0 * math.pi) - math.pi
+    sin_ha = np.sin(hour_angle)
+    cos_ha = np.cos(hour_angle)
+    sin_dec = np.sin(dec_rad)
+    cos_dec = np.cos(dec_rad)
+    sin_lat = location.sin_latitude
+    cos_lat = location.cos_latitude
+
+    x = cos_lat * sin_dec - sin_lat * cos_ha * cos_dec
+    y = -sin_ha * cos_dec
+    z = sin_lat * sin_dec + cos_lat * cos_ha * cos_dec
+    altitude = np.arctan2(z, np.hypot(x, y))
+    azimuth = np.mod(np.arctan2(y, x), 2.0 * math.pi)
+    parallactic_angle = np.arctan2(
+        cos_lat * sin_ha, sin_lat * cos_dec - cos_lat * sin_dec * cos_ha
+    )
+    return HorizontalCoordinates(hour_angle, altitude, azimuth, parallactic_angle)
@@ -0,0 +1,347 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import math
+from collections import namedtuple
+
+import numpy as np
+import palpy
+
+from .coordinates import radec_to_altaz
+from .nights import SECONDS_IN_DAY, _as_output
+from .time_scales import TT_MINUS_TAI, tai_utc
+
+__all__ = ["BodyEphemeris", "BodyPositions", "moon_ra_dec", "sun_ra_dec"]
+
+# MJD of the J2000.0 epoch.
+_MJD_J2000 = 51544.5
+
+BodyPositions = namedtuple(
+    "BodyPositions",
+    [
+        "sun_ra",
+        "sun_dec",
+        "sun_alt",
+        "sun_az",
+        "moon_ra",
+        "moon_dec",
+        "moon_alt",
+        "moon_az",
+        "moon_phase",
+        "moon_elongation",
+    ],
+)
+BodyPositions.__doc__ = """Positions of the Sun and the Moon.
+
+All the angles are in radians. The altitudes and azimuths are geometric,
+without refraction.
+
+Parameters
+----------
+sun_ra : `float` or `numpy.ndarray`
+    Right ascension of the Sun, in the range [0, 2 pi).
+sun_dec : `float` or `numpy.ndarray`
+    Declination of the Sun.
+sun_alt : `float` or `numpy.ndarray`
+    Altitude of the center of the Sun.
+sun_az : `float` or `numpy.ndarray`
+    Azimuth of the Sun, from North through East.
+moon_ra : `float` or `numpy.ndarray`
+    Topocentric right ascension of the Moon, in the range [0, 2 pi).
+moon_dec : `float` or `numpy.ndarray`
+    Topocentric declination of the Moon.
+moon_alt : `float` or `numpy.ndarray`
+    Altitude of the center of the Moon.
+moon_az : `float` or `numpy.ndarray`
+    Azimuth of the Moon, from North through East.
+moon_phase : `float` or `numpy.ndarray`
+    Illuminated fraction of the Moon disk, from 0 at new Moon to 1 at full
+    Moon.
+moon_elongation : `float` or `numpy.ndarray`
+    Geocentric angle between the Sun and the Moon.
+"""
+
+
+def sun_ra_dec(mjd):
+    """Low precision apparent position of the Sun.
+
+    This uses the algorithm of the Astronomical Almanac, which is accurate to
+    0.01 degrees between 1950 and 2050.
+
+    Parameters
+    ----------
+    mjd : `numpy.ndarray` or `float`
+        Modified Julian Date. The difference between UTC and TT is well
+        below the accuracy of the algorithm.
+
+    Returns
+    -------
+    (`numpy.ndarray`, `numpy.ndarray`)
+        The right ascension, in the range [0, 2 pi), and declination
+        (radians) of the Sun.
+    """
+    days = np.subtract(mjd, _MJD_J2000)
+    mean_longitude = np.radians(280.460 + 0.9856474 * days)
+    mean_anomaly = np.radians(357.528 + 0.9856003 * days)
+    ecliptic_longitude = (
+        mean_longitude
+        + math.radians(1.915) * np.sin(mean_anomaly)
+        + math.radians(0.020) * np.sin(2.0 * mean_anomaly)
+    )
+    obliquity = np.radians(23.439 - 0.0000004 * days)
+    sin_longitude = np.sin(ecliptic_longitude)
+    ra = np.arctan2(np.cos(obliquity) * sin_longitude, np.cos(ecliptic_longitude))
+    dec = np.arcsin(np.sin(obliquity) * sin_longitude)
+    return (np.mod(ra, 2.0 * math.pi), dec)
+
+
+def moon_ra_dec(mjd, lst_rad=None, location=None):
+    """Low precision position of the Moon.
+
+    This uses `palpy.dmoonVector`, which is accurate to about 10 arcsec.
+
+    Parameters
+    ----------
+    mjd : `numpy.ndarray` or `float`
+        Modified Julian Date in Terrestrial Time. UTC gives errors of about
+        30 arcsec, from the motion of the Moon.
+    lst_rad : `numpy.ndarray` or `float`, optional
+        Local Sidereal Time (radians) of the observer.
+    location : `lsst.ts.dateloc.ObservatoryLocation`, optional
+        The location of the observer. If given with the sidereal time, the
+        topocentric position is calculated instead of the geocentric one.
+
+    Returns
+    -------
+    (`numpy.ndarray`, `numpy.ndarray`, `numpy.ndarray`)
+        The right ascension, in the range [0, 2 pi), and declination
+        (radians) of the Moon, and its distance (AU), on the mean equator
+        and equinox of date.
+    """
+    position = _moon_position(mjd)
+    if location is not None and lst_rad is not None:
+        position = _topocentric(position, lst_rad, location)
+    return tuple(_as_output(value) for value in _spherical(position))
+
+
+def _moon_position(mjd):
+    """Geocentric cartesian position of the Moon.
+
+    Parameters
+    ----------
+    mjd : `numpy.ndarray` or `float`
+        Modified Julian Date in Terrestrial Time.
+
+    Returns
+    -------
+    (`numpy.ndarray`, `numpy.ndarray`, `numpy.ndarray`)
+        The x, y and z coordinates (AU) on the mean equator and equinox of
+        date, with the shape of the dates.
+    """
+    mjd = np.asarray(mjd, dtype=float)
+    position = palpy.dmoonVector(mjd.reshape(-1))[:3]
+    return tuple(value.reshape(mjd.shape) for value in position)
+
+
+def _topocentric(position, lst_rad, location):
+    """Move a geocentric position to the observer.
+
+    Parameters
+    ----------
+    position : (`numpy.ndarray`, `numpy.ndarray`, `numpy.ndarray`)
+        The geocentric x, y and z coordinates (AU) on the equator of date.
+    lst_rad : `numpy.ndarray` or `float`
+        Local Sidereal Time (radians) of the observer.
+    location : `lsst.ts.dateloc.ObservatoryLocation`
+        The location of the observer.
+
+    Returns
+    -------
+    (`numpy.ndarray`, `numpy.ndarray`, `numpy.ndarray`)
+        The x, y and z coordinates (AU) relative to the observer.
+    """
+    axis_distance, equator_distance = palpy.geoc(location.latitude_rad, location.height)
+    x, y, z = position
+    return (
+        x - axis_distance * np.cos(lst_rad),
+        y - axis_distance * np.sin(lst_rad),
+        z - equator_distance,
+    )
+
+
+def _spherical(position):
+    """Convert a cartesian position to spherical coordinates.
+
+    Parameters
+    ----------
+    position : (`numpy.ndarray`, `numpy.ndarray`, `numpy.ndarray`)
+        The x, y and z coordinates.
+
+    Returns
+    -------
+    (`numpy.ndarray`, `numpy.ndarray`, `numpy.ndarray`)
+        The right ascension, in the range [0, 2 pi), the declination
+        (radians) and the distance.
+    """
+    x, y, z = position
+    distance = np.sqrt(x * x + y * y + z * z)
+    ra = np.mod(np.arctan2(y, x), 2.0 * math.pi)
+    dec = np.arcsin(z / distance)
+    return (ra, dec, distance)
+
+
+class BodyEphemeris(object):
+    """This class calculates the positions of the Sun and the Moon for the
+    timestamp of a date profile.
+
+    The positions are calculated from the MJD and LST of the date profile,
+    the first time they are read after an `DateProfile.update`, and reused
+    until the timestamp, the location, the ``legacy_mjd`` flag or the
+    ``dut1_table`` of the date profile changes. The Sun comes from
+    `sun_ra_dec` and the Moon from `moon_ra_dec`, with the MJD converted to
+    Terrestrial Time.
+
+    Parameters
+    ----------
+    date_profile : `lsst.ts.dateloc.DateProfile`
+        The date profile giving the timestamp and the location.
+    """
+
+    __slots__ = ("date_profile", "_key", "_positions")
+
+    def __init__(self, date_profile):
+        self.date_profile = date_profile
+        self._key = None
+        self._positions = None
+
+    @property
+    def positions(self):
+        """Positions of the Sun and the Moon for the internal timestamp of
+        the date profile.
+
+        Returns
+        -------
+        `BodyPositions`
+            The positions, as `float` values.
+        """
+        date_profile = self.date_profile
+        key = self._cache_key()
+        if self._key != key:
+            positions = _body_positions(
+                date_profile.mjd,
+                date_profile.timestamp,
+                date_profile.lst_rad,
+                date_profile.location,
+            )
+            self._positions = BodyPositions(*(float(value) for value in positions))
+            self._key = key
+        return self._positions
+
+    def _cache_key(self):
+        """Key of the cached positions.
+
+        Returns
+        -------
+        `tuple`
+            The values of the date profile the positions depend on.
+        """
+        date_profile = self.date_profile
+        location = date_profile.location
+        return (
+            date_profile.timestamp,
+            location,
+            location.version,
+            date_profile.legacy_mjd,
+            date_profile.dut1_table,
+        )
+
+    def compute_many(self, timestamps):
+        """Positions of the Sun and the Moon for many timestamps.
+
+        The internal timestamp of the date profile is not changed.
+
+        Parameters
+        ----------
+        timestamps : `numpy.ndarray` or `float`
+            The UTC timestamps, e.g. a grid covering a night.
+
+        Returns
+        -------
+        `BodyPositions`
+            The positions, as arrays with the shape of the timestamps.
+        """
+        timestamps = np.asarray(timestamps, dtype=float)
+        mjd, lst_rad = self.date_profile.compute_many(timestamps)
+        positions = _body_positions(
+            mjd, timestamps, lst_rad, self.date_profile.location
+        )
+        return BodyPositions(*(np.asarray(value) for value in positions))
+
+
+def _body_positions(mjd, timestamps, lst_rad, location):
+    """Calculate the positions of the Sun and the Moon.
+
+    Parameters
+    ----------
+    mjd : `numpy.ndarray` or `float`
+        The UTC Modified Julian Dates.
+    timestamps : `numpy.ndarray` or `float`
+        The UTC timestamps, giving the leap seconds.
+    lst_rad : `numpy.ndarray` or `float`
+        The Local Sidereal Times (radians).
+    location : `lsst.ts.dateloc.ObservatoryLocation`
+        The location of the observer.
+
+    Returns
+    -------
+    `BodyPositions`
+        The positions.
+    """
+    mjd_tt = mjd + (tai_utc(timestamps) + TT_MINUS_TAI) / SECONDS_IN_DAY
+    sun_ra, sun_dec = sun_ra_dec(mjd_tt)
+    sun = radec_to_altaz(sun_ra, sun_dec, lst_rad, location)
+
+    # The phase uses the geocentric directions. The distance of the Sun
+    # is taken as 1 AU, which changes the illuminated fraction by less
+    # than 1e-4.
+    position = _moon_position(mjd_tt)
+    geocentric_ra, geocentric_dec, moon_distance = _spherical(position)
+    cos_elongation = np.sin(sun_dec) * np.sin(geocentric_dec)
+    cos_elongation += (
+        np.cos(sun_dec) * np.cos(geocentric_dec) * np.cos(sun_ra - geocentric_ra)
+    )
+    elongation = np.arccos(np.clip(cos_elongation, -1.0, 1.0))
+    phase_angle = np.arctan2(np.sin(elongation), moon_distance - np.cos(elongation))
+    phase = (1.0 + np.cos(phase_angle)) / 2.0
+
+    moon_ra, moon_dec, _ = _spherical(_topocentric(position, lst_rad, location))
+    moon = radec_to_altaz(moon_ra, moon_dec, lst_rad, location)
+    return BodyPositions(
+        sun_ra,
+        sun_dec,
+        sun.altitude,
+        sun.azimuth,
+        moon_ra,
+        moon_dec,
+        moon.altitude,
+        moon.azimuth,
+        phase,
+        elongation,
+    )
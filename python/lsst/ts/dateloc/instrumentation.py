@@ -0,0 +1,217 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+"""Opt-in call counters and timers for the hot paths.
+
+`enable` replaces the instrumented methods and properties with wrappers
+that count the calls, accumulate the time spent in them and count the hits
+and misses of the memoized values. `disable` puts the original functions
+back, so there is no overhead at all while the instrumentation is disabled.
+The counters are kept until `reset` is called and are not thread safe.
+"""
+
+import functools
+import time
+
+from . import location
+from .date_profile import DateProfile
+from .ephemeris import BodyEphemeris
+from .location import ObservatoryLocation
+from .night_boundaries import NightBoundaries
+
+__all__ = ["enable", "disable", "is_enabled", "reset", "snapshot"]
+
+# Instrumented functions, as (owner, attribute, name, cache miss test).
+# The cache miss test is called with the arguments of the function before
+# it runs, and tells whether the memoized value has to be calculated. It
+# asks the instrumented class, which owns the caching logic.
+_TARGETS = (
+    (DateProfile, "update", "DateProfile.update", None),
+    (DateProfile, "__call__", "DateProfile.__call__", None),
+    (DateProfile, "compute_many", "DateProfile.compute_many", None),
+    (DateProfile, "mjd", "DateProfile.mjd", None),
+    (
+        DateProfile,
+        "gmst_rad",
+        "DateProfile.gmst_rad",
+        lambda date_profile: not date_profile._gmst_is_cached(),
+    ),
+    (
+        DateProfile,
+        "lst_rad",
+        "DateProfile.lst_rad",
+        lambda date_profile: not date_profile._lst_is_cached(),
+    ),
+    (
+        DateProfile,
+        "current_dt",
+        "DateProfile.current_dt",
+        lambda date_profile: not date_profile._current_dt_is_cached(),
+    ),
+    (
+        BodyEphemeris,
+        "positions",
+        "BodyEphemeris.positions",
+        lambda ephemeris: ephemeris._key != ephemeris._cache_key(),
+    ),
+    (ObservatoryLocation, "configure", "ObservatoryLocation.configure", None),
+    (ObservatoryLocation, "for_lsst", "ObservatoryLocation.for_lsst", None),
+    (ObservatoryLocation, "reconfigure", "ObservatoryLocation.reconfigure", None),
+    (
+        location,
+        "_get_site",
+        "ObservatoryLocation.site",
+        lambda name: location._cached_site(name) is None,
+    ),
+    (
+        NightBoundaries,
+        "__call__",
+        "NightBoundaries.__call__",
+        lambda night_boundaries, midnight: night_boundaries._cache_key(midnight)
+        not in night_boundaries._cache,
+    ),
+)
+
+# Number of calls and accumulated time (seconds), by name.
+_calls = dict.fromkeys((target[2] for target in _TARGETS), 0)
+_times = dict.fromkeys((target[2] for target in _TARGETS), 0.0)
+# Cache hits and misses, by name.
+_hits = {target[2]: 0 for target in _TARGETS if target[3] is not None}
+_misses = dict.fromkeys(_hits, 0)
+# Original attributes replaced by the wrappers, as (owner, attribute, value).
+_originals = []
+
+
+def _wrap(function, name, is_miss):
+    """Wrap a function to count its calls and time.
+
+    Parameters
+    ----------
+    function : `callable`
+        The function to wrap.
+    name : `str`
+        The name of the counters.
+    is_miss : `callable` or `None`
+        The cache miss test, if the function returns a memoized value.
+
+    Returns
+    -------
+    `callable`
+        The wrapper.
+    """
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if is_miss is not None:
+            if is_miss(*args, **kwargs):
+                _misses[name] += 1
+            else:
+                _hits[name] += 1
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _times[name] += time.perf_counter() - start
+            _calls[name] += 1
+
+    return wrapper
+
+
+def enable():
+    """Start counting the calls, time and cache hits of the hot paths.
+
+    Calling it again while enabled does nothing.
+    """
+    if _originals:
+        return
+    for owner, attribute, name, is_miss in _TARGETS:
+        original = vars(owner)[attribute]
+        if isinstance(original, property):
+            replacement = property(
+                _wrap(original.fget, name, is_miss),
+                original.fset,
+                original.fdel,
+                original.__doc__,
+            )
+        else:
+            replacement = _wrap(original, name, is_miss)
+        _originals.append((owner, attribute, original))
+        setattr(owner, attribute, replacement)
+
+
+def disable():
+    """Stop counting and restore the original functions.
+
+    The counters keep their values.
+    """
+    while _originals:
+        owner, attribute, original = _originals.pop()
+        setattr(owner, attribute, original)
+
+
+def is_enabled():
+    """Tell whether the instrumentation is enabled.
+
+    Returns
+    -------
+    `bool`
+        True if the calls are being counted.
+    """
+    return bool(_originals)
+
+
+def reset():
+    """Set all the counters to zero."""
+    for name in _calls:
+        _calls[name] = 0
+        _times[name] = 0.0
+    for name in _hits:
+        _hits[name] = 0
+        _misses[name] = 0
+
+
+def snapshot():
+    """Get the current values of the counters.
+
+    Returns
+    -------
+    `dict`
+        The counters, with the keys:
+
+        ``enabled``
+            True if the instrumentation is enabled (`bool`).
+        ``calls``
+            The number of calls (`int`) by function name.
+        ``time``
+            The total time (seconds) spent in the calls (`float`) by
+            function name.
+        ``cache_hits``
+            The number of memoized values reused (`int`) by function name.
+        ``cache_misses``
+            The number of memoized values calculated (`int`) by function
+            name.
+    """
+    return {
+        "enabled": is_enabled(),
+        "calls": dict(_calls),
+        "time": dict(_times),
+        "cache_hits": dict(_hits),
+        "cache_misses": dict(_misses),
+    }
@@ -0,0 +1,447 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+"""Fused kernels for the timestamp to MJD, GMST and LST chain.
+
+The Greenwich Mean Sidereal Time follows ``eraGmst06`` with UT1 used as
+TT, as `palpy.gmst` does, with the operations in the same order so the
+results agree bit for bit. The kernels are compiled with numba when it is
+installed, the first time they are called, and do the whole chain in a
+single pass over the input. Otherwise the same steps run with NumPy over
+blocks of the input, reusing small scratch buffers instead of allocating
+temporaries of the size of the input.
+"""
+
+import math
+
+import numpy as np
+
+__all__ = ["gmst_kernel", "mjd_lst_kernel", "kernel_backend"]
+
+_TWO_PI = 2.0 * math.pi
+# Arcseconds to radians.
+_ARCSEC_TO_RAD = math.pi / (180.0 * 3600.0)
+_SECONDS_IN_DAY = 86400.0
+_MJD_UNIX_EPOCH = 40587.0
+_MJD_J2000 = 51544.5
+_DAYS_IN_CENTURY = 36525.0
+# Fractional part of the MJD zero point, JD 2400000.5.
+_MJD_ZERO_FRACTION = 0.5
+# Earth Rotation Angle at J2000.0 (turns) and rate (turns per UT1 day
+# beyond one).
+_ERA_J2000 = 0.7790572732640
+_ERA_RATE = 0.00273781191135448
+# Coefficients (arcsec) of the GMST polynomial in TT Julian centuries, from
+# the constant to the fifth order term.
+_GMST_COEFFICIENTS = (
+    0.014506,
+    4612.156534,
+    1.3915817,
+    -0.00000044,
+    -0.000029956,
+    -0.0000000368,
+)
+# Number of values processed at a time by the NumPy kernels.
+_BLOCK_SIZE = 4096
+
+# Compiled kernels, None until numba has been looked for and False if it
+# is not installed.
+_numba_kernels = None
+
+
+def _divmod_day(timestamp):
+    """Split a timestamp into days and seconds like `divmod`.
+
+    Parameters
+    ----------
+    timestamp : `float`
+        The UTC timestamp.
+
+    Returns
+    -------
+    days : `float`
+        The whole days from 1970-01-01.
+    seconds : `float`
+        The seconds since the start of the day.
+    """
+    seconds = math.fmod(timestamp, _SECONDS_IN_DAY)
+    days = (timestamp - seconds) / _SECONDS_IN_DAY
+    if seconds < 0.0:
+        seconds += _SECONDS_IN_DAY
+        days -= 1.0
+    whole_days = math.floor(days)
+    if days - whole_days > 0.5:
+        whole_days += 1.0
+    return (whole_days, seconds)
+
+
+def _wrap_angle(angle):
+    """Wrap an angle into [0, 2 pi) like ``eraAnp``.
+
+    Parameters
+    ----------
+    angle : `float`
+        The angle (radians).
+
+    Returns
+    -------
+    `float`
+        The wrapped angle (radians).
+    """
+    angle = math.fmod(angle, _TWO_PI)
+    if angle < 0.0:
+        angle += _TWO_PI
+    return angle
+
+
+def _gmst06(ut1_mjd):
+    """Greenwich Mean Sidereal Time of a UT1 Modified Julian Date.
+
+    Parameters
+    ----------
+    ut1_mjd : `float`
+        The Modified Julian Date on the UT1 scale, also used as TT.
+
+    Returns
+    -------
+    `float`
+        The Greenwich Mean Sidereal Time (radians), in the range [0, 2 pi).
+    """
+    days = ut1_mjd - _MJD_J2000
+    fraction = math.fmod(ut1_mjd, 1.0) + _MJD_ZERO_FRACTION
+    era = _wrap_angle(_TWO_PI * (fraction + _ERA_J2000 + _ERA_RATE * days))
+    centuries = days / _DAYS_IN_CENTURY
+    c0, c1, c2, c3, c4, c5 = _GMST_COEFFICIENTS
+    polynomial = c4 + c5 * centuries
+    polynomial = c3 + polynomial * centuries
+    polynomial = c2 + polynomial * centuries
+    polynomial = c1 + polynomial * centuries
+    polynomial = c0 + polynomial * centuries
+    return _wrap_angle(era + polynomial * _ARCSEC_TO_RAD)
+
+
+def _make_loops(jit):
+    """Create the single pass kernels.
+
+    Parameters
+    ----------
+    jit : `callable`
+        The decorator compiling the functions, or the identity to run them
+        as plain Python.
+
+    Returns
+    -------
+    gmst_loop : `callable`
+        The kernel writing the GMST of UT1 MJDs into an array.
+    mjd_lst_loop : `callable`
+        The kernel writing the MJD and LST of timestamps into arrays.
+    """
+    divmod_day = jit(_divmod_day)
+    gmst06 = jit(_gmst06)
+
+    def gmst_loop(ut1_mjd, gmst_out):
+        for i in range(ut1_mjd.size):
+            gmst_out[i] = gmst06(ut1_mjd[i])
+
+    def mjd_lst_loop(timestamps, longitude_rad, mjd_out, lst_out):
+        for i in range(timestamps.size):
+            days, seconds = divmod_day(timestamps[i])
+            mjd = days + _MJD_UNIX_EPOCH + seconds / _SECONDS_IN_DAY
+            lst = gmst06(mjd) + longitude_rad
+            if lst < 0.0:
+                lst += _TWO_PI
+            mjd_out[i] = mjd
+            lst_out[i] = lst
+
+    return (jit(gmst_loop), jit(mjd_lst_loop))
+
+
+def _get_numba_kernels():
+    """Get the numba kernels, compiling them on first use.
+
+    Returns
+    -------
+    `tuple` or `None`
+        The compiled kernels of `_make_loops`, or None if numba is not
+        installed.
+    """
+    global _numba_kernels
+    if _numba_kernels is None:
+        try:
+            # Imported here, since numba is optional and slow to import.
+            import numba
+        except ImportError:
+            _numba_kernels = False
+        else:
+            _numba_kernels = _make_loops(numba.njit(nogil=True))
+    return _numba_kernels or None
+
+
+def kernel_backend():
+    """Name of the implementation of the kernels.
+
+    Returns
+    -------
+    `str`
+        "numba" if the kernels are compiled with numba, otherwise "numpy".
+    """
+    return "numpy" if _get_numba_kernels() is None else "numba"
+
+
+def _wrap_angles(angles, mask):
+    """Wrap angles into [0, 2 pi) in place like ``eraAnp``.
+
+    Parameters
+    ----------
+    angles : `numpy.ndarray`
+        The angles (radians).
+    mask : `numpy.ndarray`
+        Boolean scratch buffer with the shape of the angles.
+    """
+    np.fmod(angles, _TWO_PI, out=angles)
+    np.less(angles, 0.0, out=mask)
+    np.add(angles, _TWO_PI, out=angles, where=mask)
+
+
+def _gmst_block(ut1_mjd, gmst_out, days, scratch, mask):
+    """Calculate the GMST of a block of UT1 MJDs with NumPy.
+
+    The steps follow `_gmst06`.
+
+    Parameters
+    ----------
+    ut1_mjd : `numpy.ndarray`
+        The Modified Julian Dates on the UT1 scale.
+    gmst_out : `numpy.ndarray`
+        The array receiving the GMST (radians).
+    days, scratch : `numpy.ndarray`
+        Scratch buffers with the shape of the dates.
+    mask : `numpy.ndarray`
+        Boolean scratch buffer with the shape of the dates.
+    """
+    np.subtract(ut1_mjd, _MJD_J2000, out=days)
+    np.fmod(ut1_mjd, 1.0, out=gmst_out)
+    np.add(gmst_out, _MJD_ZERO_FRACTION, out=gmst_out)
+    np.add(gmst_out, _ERA_J2000, out=gmst_out)
+    np.multiply(days, _ERA_RATE, out=scratch)
+    np.add(gmst_out, scratch, out=gmst_out)
+    np.multiply(gmst_out, _TWO_PI, out=gmst_out)
+    _wrap_angles(gmst_out, mask)
+
+    centuries = np.divide(days, _DAYS_IN_CENTURY, out=days)
+    c0, c1, c2, c3, c4, c5 = _GMST_COEFFICIENTS
+    np.multiply(centuries, c5, out=scratch)
+    for coefficient in (c4, c3, c2, c1):
+        np.add(scratch, coefficient, out=scratch)
+        np.multiply(scratch, centuries, out=scratch)
+    np.add(scratch, c0, out=scratch)
+    np.multiply(scratch, _ARCSEC_TO_RAD, out=scratch)
+    np.add(gmst_out, scratch, out=gmst_out)
+    _wrap_angles(gmst_out, mask)
+
+
+def _blocks(size):
+    """Split an array size into blocks.
+
+    Parameters
+    ----------
+    size : `int`
+        The size of the array.
+
+    Returns
+    -------
+    `list` [`slice`]
+        The slices of the blocks.
+    """
+    return [
+        slice(first, min(first + _BLOCK_SIZE, size))
+        for first in range(0, size, _BLOCK_SIZE)
+    ]
+
+
+def _scratch(size):
+    """Allocate the scratch buffers of the NumPy kernels.
+
+    Parameters
+    ----------
+    size : `int`
+        The size of the input.
+
+    Returns
+    -------
+    (`numpy.ndarray`, `numpy.ndarray`, `numpy.ndarray`)
+        Two float buffers and a boolean one, of the block size at most.
+    """
+    size = min(size, _BLOCK_SIZE)
+    return (np.empty(size), np.empty(size), np.empty(size, dtype=bool))
+
+
+def _gmst_numpy(ut1_mjd, gmst_out):
+    """Calculate the GMST of UT1 MJDs with NumPy, block by block.
+
+    Parameters
+    ----------
+    ut1_mjd : `numpy.ndarray`
+        One dimensional array of Modified Julian Dates on the UT1 scale.
+    gmst_out : `numpy.ndarray`
+        One dimensional array receiving the GMST (radians).
+    """
+    days, scratch, mask = _scratch(ut1_mjd.size)
+    for block in _blocks(ut1_mjd.size):
+        size = block.stop - block.start
+        _gmst_block(
+            ut1_mjd[block], gmst_out[block], days[:size], scratch[:size], mask[:size]
+        )
+
+
+def _mjd_lst_numpy(timestamps, longitude_rad, mjd_out, lst_out):
+    """Calculate the MJD and LST of timestamps with NumPy, block by block.
+
+    Parameters
+    ----------
+    timestamps : `numpy.ndarray`
+        One dimensional array of UTC timestamps.
+    longitude_rad : `float`
+        The longitude (radians) of the location.
+    mjd_out : `numpy.ndarray`
+        One dimensional array receiving the MJD.
+    lst_out : `numpy.ndarray`
+        One dimensional array receiving the LST (radians).
+    """
+    days, scratch, mask = _scratch(timestamps.size)
+    for block in _blocks(timestamps.size):
+        size = block.stop - block.start
+        mjd = mjd_out[block]
+        lst = lst_out[block]
+        np.divmod(timestamps[block], _SECONDS_IN_DAY, out=(mjd, lst))
+        np.add(mjd, _MJD_UNIX_EPOCH, out=mjd)
+        np.divide(lst, _SECONDS_IN_DAY, out=lst)
+        np.add(mjd, lst, out=mjd)
+        _gmst_block(mjd, lst, days[:size], scratch[:size], mask[:size])
+        np.add(lst, longitude_rad, out=lst)
+        np.less(lst, 0.0, out=mask[:size])
+        np.add(lst, _TWO_PI, out=lst, where=mask[:size])
+
+
+def _output(out, shape, name):
+    """Check or allocate an output array.
+
+    Parameters
+    ----------
+    out : `numpy.ndarray` or `None`
+        The array given by the caller.
+    shape : `tuple`
+        The shape of the input.
+    name : `str`
+        The name of the output in the error messages.
+
+    Returns
+    -------
+    `numpy.ndarray`
+        The output array.
+
+    Raises
+    ------
+    ValueError
+        If the array given does not have the shape of the input, or is not
+        a writeable C contiguous float64 array.
+    """
+    if out is None:
+        return np.empty(shape)
+    if (
+        not isinstance(out, np.ndarray)
+        or out.shape != shape
+        or out.dtype != np.float64
+        or not out.flags.c_contiguous
+        or not out.flags.writeable
+    ):
+        raise ValueError(
+            f"{name} must be a writeable C contiguous float64 array of shape {shape}."
+        )
+    return out
+
+
+def gmst_kernel(ut1_mjd, out=None):
+    """Greenwich Mean Sidereal Time of UT1 Modified Julian Dates.
+
+    This gives the values of `palpy.gmstVector` in a single pass.
+
+    Parameters
+    ----------
+    ut1_mjd : `numpy.ndarray` or `float`
+        The Modified Julian Dates on the UT1 scale.
+    out : `numpy.ndarray`, optional
+        A C contiguous float64 array with the shape of the dates receiving
+        the result.
+
+    Returns
+    -------
+    `numpy.ndarray`
+        The Greenwich Mean Sidereal Times (radians), in the range
+        [0, 2 pi).
+    """
+    ut1_mjd = np.asarray(ut1_mjd, dtype=float, order="C")
+    out = _output(out, ut1_mjd.shape, "out")
+    kernels = _get_numba_kernels()
+    if kernels is None:
+        _gmst_numpy(ut1_mjd.reshape(-1), out.reshape(-1))
+    else:
+        kernels[0](ut1_mjd.reshape(-1), out.reshape(-1))
+    return out
+
+
+def mjd_lst_kernel(timestamps, longitude_rad, out=None):
+    """Modified Julian Date and Local Sidereal Time of UTC timestamps.
+
+    The MJD keeps the fractional seconds, as in `DateProfile`, and is used
+    as UT1 for the sidereal time.
+
+    Parameters
+    ----------
+    timestamps : `numpy.ndarray` or `float`
+        The UTC timestamps.
+    longitude_rad : `float`
+        The longitude (radians) of the location.
+    out : (`numpy.ndarray`, `numpy.ndarray`), optional
+        C contiguous float64 arrays with the shape of the timestamps
+        receiving the MJD and LST.
+
+    Returns
+    -------
+    (`numpy.ndarray`, `numpy.ndarray`)
+        The Modified Julian Dates and Local Sidereal Times (radians), with
+        the same values as `DateProfile.compute_many`.
+    """
+    timestamps = np.asarray(timestamps, dtype=float, order="C")
+    mjd_out, lst_out = (None, None) if out is None else out
+    mjd_out = _output(mjd_out, timestamps.shape, "The MJD output")
+    lst_out = _output(lst_out, timestamps.shape, "The LST output")
+    kernels = _get_numba_kernels()
+    arguments = (
+        timestamps.reshape(-1),
+        float(longitude_rad),
+        mjd_out.reshape(-1),
+        lst_out.reshape(-1),
+    )
+    if kernels is None:
+        _mjd_lst_numpy(*arguments)
+    else:
+        kernels[1](*arguments)
+    return (mjd_out, lst_out)
@@ -18,12 +18,141 @@
 #
 # You should have received a copy of the GNU General Public License
 
+import hashlib
 import math
-
-import rubin_scheduler.utils as rs_utils
+import struct
+from collections import namedtuple
 
 __all__ = ["ObservatoryLocation"]
 
+# Values of rubin_scheduler.utils.Site for the Rubin Observatory sites, so
+# they can be read without importing rubin_scheduler. The test stands
+# simulate the summit, so they use the LSST parameters.
+_SITE_PARAMETERS = {
+    "LSST": {"latitude": -30.244628, "longitude": -70.74941, "height": 2650.0},
+    "AuxTel": {"latitude": -30.244789, "longitude": -70.747686, "height": 2650.0},
+}
+_SITE_PARAMETERS["TTS"] = _SITE_PARAMETERS["LSST"]
+_SITE_PARAMETERS["BTS"] = _SITE_PARAMETERS["LSST"]
+
+# Site records already created, by site name.
+_SITE_CACHE = {}
+
+
+class _Site(
+    namedtuple(
+        "_Site",
+        ["latitude_rad", "longitude_rad", "height", "sin_latitude", "cos_latitude"],
+    )
+):
+    """Immutable record of the site information shared between locations."""
+
+    __slots__ = ()
+
+    @classmethod
+    def create(cls, latitude_rad, longitude_rad, height):
+        """Create a record, precomputing the latitude sine and cosine.
+
+        Parameters
+        ----------
+        latitude_rad : `float`
+            The latitude (radians) position of the observatory.
+        longitude_rad : `float`
+            The longitude (radians) position of the observatory.
+        height : `float`
+            The elevation (meters) of the observatory.
+
+        Returns
+        -------
+        `_Site`
+            The site record.
+        """
+        return cls(
+            latitude_rad,
+            longitude_rad,
+            height,
+            math.sin(latitude_rad),
+            math.cos(latitude_rad),
+        )
+
+
+def _get_site_parameters(name):
+    """Get the parameters of an observatory site.
+
+    The built-in table is checked first. Other sites are looked up in
+    `rubin_scheduler.utils.Site`, which is only imported when needed.
+
+    Parameters
+    ----------
+    name : `str`
+        The name of the site.
+
+    Returns
+    -------
+    `dict`
+        The latitude (degrees), longitude (degrees) and height (meters) of
+        the site.
+
+    Raises
+    ------
+    ValueError
+        If the site is not known.
+    """
+    try:
+        return _SITE_PARAMETERS[name]
+    except KeyError:
+        import rubin_scheduler.utils as rs_utils
+
+        site = rs_utils.Site(name=name)
+        if site.latitude is None or site.longitude is None or site.height is None:
+            raise ValueError(f"Unknown observatory site {name!r}.")
+        return {
+            "latitude": site.latitude,
+            "longitude": site.longitude,
+            "height": site.height,
+        }
+
+
+def _cached_site(name):
+    """Get the record of an observatory site if it is already created.
+
+    Parameters
+    ----------
+    name : `str`
+        The name of the site.
+
+    Returns
+    -------
+    `_Site` or `None`
+        The site record, or None if it is not created yet.
+    """
+    return _SITE_CACHE.get(name)
+
+
+def _get_site(name):
+    """Get the cached record of an observatory site.
+
+    Parameters
+    ----------
+    name : `str`
+        The name of the site.
+
+    Returns
+    -------
+    `_Site`
+        The site record.
+    """
+    site = _cached_site(name)
+    if site is None:
+        parameters = _get_site_parameters(name)
+        site = _Site.create(
+            math.radians(parameters["latitude"]),
+            math.radians(parameters["longitude"]),
+            parameters["height"],
+        )
+        _SITE_CACHE[name] = site
+    return site
+
 
 class ObservatoryLocation(object):
     """Class for the observatory location.
@@ -39,8 +168,18 @@ class ObservatoryLocation(object):
         The latitude of the observatory in radians.
     longitude_rad : `float`
         The longitude of the observatory in radians.
+    version : `int`
+        Counter incremented every time the location information changes.
+
+    Notes
+    -----
+    The location information is kept in an immutable record. Locations
+    created for the same site with `from_site` share the cached record, and
+    any change creates a new record for the changed location only.
     """
 
+    __slots__ = ("_site", "_version")
+
     def __init__(self, latitude_rad=0.0, longitude_rad=0.0, height=0.0):
         """Initialize the class.
 
@@ -53,9 +192,51 @@ class ObservatoryLocation(object):
         height : `float`
             The elevation (meters) of the observatory.
         """
-        self.height = height
-        self.latitude_rad = latitude_rad
-        self.longitude_rad = longitude_rad
+        self._version = 0
+        self._set_site(_Site.create(latitude_rad, longitude_rad, height))
+
+    @classmethod
+    def from_site(cls, name):
+        """Create the location of a known observatory site.
+
+        The built-in sites are "LSST", "AuxTel" and the "TTS" and "BTS" test
+        stands. Other names are looked up in `rubin_scheduler.utils.Site`.
+
+        Parameters
+        ----------
+        name : `str`
+            The name of the site.
+
+        Returns
+        -------
+        `ObservatoryLocation`
+            The location sharing the cached site information.
+
+        Raises
+        ------
+        ValueError
+            If the site is not known.
+        """
+        location = cls.__new__(cls)
+        location._version = 0
+        location._set_site(_get_site(name))
+        return location
+
+    def copy(self):
+        """Copy the instance.
+
+        The copy shares the site record with the original until either of
+        them changes.
+
+        Returns
+        -------
+        `ObservatoryLocation`
+            The copy of the instance.
+        """
+        other = type(self).__new__(type(self))
+        other._site = self._site
+        other._version = self._version
+        return other
 
     @classmethod
     def get_configure_dict(cls):
@@ -66,16 +247,132 @@ class ObservatoryLocation(object):
         `dict`
             The configuration dictionary for the observatory location.
         """
-        lsst = rs_utils.Site(name="LSST")
-        conf_dict = {
-            "obs_site": {
-                "latitude": lsst.latitude,
-                "longitude": lsst.longitude,
-                "height": lsst.height,
-            }
-        }
+        conf_dict = {"obs_site": dict(_get_site_parameters("LSST"))}
         return conf_dict
 
+    def _set_site(self, site):
+        """Replace the site information.
+
+        Parameters
+        ----------
+        site : `_Site`
+            The new site record.
+        """
+        self._site = site
+        self._version += 1
+
+    @property
+    def height(self):
+        """Observatory elevation.
+
+        Returns
+        -------
+        `float`
+            Observatory elevation in meters.
+        """
+        return self._site.height
+
+    @height.setter
+    def height(self, height):
+        self._set_site(self._site._replace(height=height))
+
+    @property
+    def latitude_rad(self):
+        """Observatory latitude.
+
+        Returns
+        -------
+        `float`
+            Observatory latitude in radians.
+        """
+        return self._site.latitude_rad
+
+    @latitude_rad.setter
+    def latitude_rad(self, latitude_rad):
+        self._set_site(
+            _Site.create(latitude_rad, self._site.longitude_rad, self._site.height)
+        )
+
+    @property
+    def longitude_rad(self):
+        """Observatory longitude.
+
+        Returns
+        -------
+        `float`
+            Observatory longitude in radians.
+        """
+        return self._site.longitude_rad
+
+    @longitude_rad.setter
+    def longitude_rad(self, longitude_rad):
+        self._set_site(self._site._replace(longitude_rad=longitude_rad))
+
+    @property
+    def sin_latitude(self):
+        """Sine of the observatory latitude.
+
+        Returns
+        -------
+        `float`
+            The precomputed sine of the latitude.
+        """
+        return self._site.sin_latitude
+
+    @property
+    def cos_latitude(self):
+        """Cosine of the observatory latitude.
+
+        Returns
+        -------
+        `float`
+            The precomputed cosine of the latitude.
+        """
+        return self._site.cos_latitude
+
+    @property
+    def utc_offset(self):
+        """Offset of the local mean solar time from UTC.
+
+        Returns
+        -------
+        `float`
+            The offset (seconds), positive east of Greenwich.
+        """
+        return self._site.longitude_rad / (2.0 * math.pi) * 86400.0
+
+    @property
+    def site_hash(self):
+        """Stable hash of the location information.
+
+        Unlike `version`, it only depends on the latitude, longitude and
+        height, so it is the same in every process and session for the same
+        location. It is meant as a key for persistent caches.
+
+        Returns
+        -------
+        `str`
+            The hexadecimal SHA-1 digest of the latitude (radians), longitude
+            (radians) and height (meters) as little endian doubles.
+        """
+        site = self._site
+        data = struct.pack("<ddd", site.latitude_rad, site.longitude_rad, site.height)
+        return hashlib.sha1(data).hexdigest()
+
+    @property
+    def version(self):
+        """Counter of the changes to the location information.
+
+        Objects caching values derived from the location can compare this
+        against the value seen at caching time to detect a change.
+
+        Returns
+        -------
+        `int`
+            The number of times the location information has been set.
+        """
+        return self._version
+
     @property
     def latitude(self):
         """Observatory latitude.
@@ -115,16 +412,17 @@ class ObservatoryLocation(object):
         location_confdict : `dict`
             The observatory information.
         """
-        self.latitude_rad = math.radians(location_confdict["obs_site"]["latitude"])
-        self.longitude_rad = math.radians(location_confdict["obs_site"]["longitude"])
-        self.height = location_confdict["obs_site"]["height"]
+        self._set_site(
+            _Site.create(
+                math.radians(location_confdict["obs_site"]["latitude"]),
+                math.radians(location_confdict["obs_site"]["longitude"]),
+                location_confdict["obs_site"]["height"],
+            )
+        )
 
     def for_lsst(self):
         """A convenience function to set the observatory location for LSST."""
-        lsst = rs_utils.Site(name="LSST")
-        self.latitude_rad = math.radians(lsst.latitude)
-        self.longitude_rad = math.radians(lsst.longitude)
-        self.height = lsst.height
+        self._set_site(_get_site("LSST"))
 
     def reconfigure(self, latitude_rad, longitude_rad, height):
         """Override the current observatory information.
@@ -138,6 +436,4 @@ class ObservatoryLocation(object):
         height : `float`
             The elevation (meters) of the observatory.
         """
-        self.latitude_rad = latitude_rad
-        self.longitude_rad = longitude_rad
-        self.height = height
+        self._set_site(_Site.create(latitude_rad, longitude_rad, height))
@@ -0,0 +1,255 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import math
+
+import numpy as np
+
+from .location import ObservatoryLocation
+
+__all__ = ["ObservatoryLocationSet"]
+
+
+class ObservatoryLocationSet(object):
+    """This class keeps the information of many observatory locations in
+    arrays, so values for all of them can be calculated at once.
+
+    The set is immutable. Its arrays are read-only and have one value per
+    location.
+
+    Parameters
+    ----------
+    latitude_rad : `numpy.ndarray`
+        The latitudes (radians) of the observatories.
+    longitude_rad : `numpy.ndarray`
+        The longitudes (radians) of the observatories.
+    height : `numpy.ndarray`
+        The elevations (meters) of the observatories.
+
+    Attributes
+    ----------
+    latitude_rad : `numpy.ndarray`
+        The latitudes of the observatories in radians.
+    longitude_rad : `numpy.ndarray`
+        The longitudes of the observatories in radians.
+    height : `numpy.ndarray`
+        The elevations of the observatories in meters.
+    sin_latitude : `numpy.ndarray`
+        The sines of the latitudes.
+    cos_latitude : `numpy.ndarray`
+        The cosines of the latitudes.
+    """
+
+    __slots__ = (
+        "_latitude_rad",
+        "_longitude_rad",
+        "_height",
+        "_sin_latitude",
+        "_cos_latitude",
+    )
+
+    def __init__(self, latitude_rad, longitude_rad, height):
+        arrays = np.broadcast_arrays(
+            np.asarray(latitude_rad, dtype=float),
+            np.asarray(longitude_rad, dtype=float),
+            np.asarray(height, dtype=float),
+        )
+        latitude_rad, longitude_rad, height = (array.flatten() for array in arrays)
+        self._latitude_rad = _read_only(latitude_rad)
+        self._longitude_rad = _read_only(longitude_rad)
+        self._height = _read_only(height)
+        self._sin_latitude = _read_only(np.sin(latitude_rad))
+        self._cos_latitude = _read_only(np.cos(latitude_rad))
+
+    @property
+    def latitude_rad(self):
+        """Observatory latitudes.
+
+        Returns
+        -------
+        `numpy.ndarray`
+            The latitudes (radians) of the observatories.
+        """
+        return self._latitude_rad
+
+    @property
+    def longitude_rad(self):
+        """Observatory longitudes.
+
+        Returns
+        -------
+        `numpy.ndarray`
+            The longitudes (radians) of the observatories.
+        """
+        return self._longitude_rad
+
+    @property
+    def height(self):
+        """Observatory elevations.
+
+        Returns
+        -------
+        `numpy.ndarray`
+            The elevations (meters) of the observatories.
+        """
+        return self._height
+
+    @property
+    def sin_latitude(self):
+        """Sines of the observatory latitudes.
+
+        Returns
+        -------
+        `numpy.ndarray`
+            The sines of the latitudes.
+        """
+        return self._sin_latitude
+
+    @property
+    def cos_latitude(self):
+        """Cosines of the observatory latitudes.
+
+        Returns
+        -------
+        `numpy.ndarray`
+            The cosines of the latitudes.
+        """
+        return self._cos_latitude
+
+    @classmethod
+    def from_locations(cls, locations):
+        """Create the set from location instances.
+
+        The set keeps the current information of the locations, it does not
+        follow later changes to them.
+
+        Parameters
+        ----------
+        locations : iterable of `lsst.ts.dateloc.ObservatoryLocation`
+            The locations.
+
+        Returns
+        -------
+        `ObservatoryLocationSet`
+            The set of locations, in the same order.
+        """
+        values = [
+            (location.latitude_rad, location.longitude_rad, location.height)
+            for location in locations
+        ]
+        return cls(*np.array(values, dtype=float).reshape(-1, 3).T)
+
+    @classmethod
+    def from_sites(cls, names):
+        """Create the set of known observatory sites.
+
+        Parameters
+        ----------
+        names : iterable of `str`
+            The names of the sites, see `ObservatoryLocation.from_site`.
+
+        Returns
+        -------
+        `ObservatoryLocationSet`
+            The set of locations, in the same order.
+
+        Raises
+        ------
+        ValueError
+            If a site is not known.
+        """
+        return cls.from_locations(ObservatoryLocation.from_site(name) for name in names)
+
+    def __len__(self):
+        return self.latitude_rad.size
+
+    def __getitem__(self, index):
+        """Get one location of the set.
+
+        Parameters
+        ----------
+        index : `int`
+            The position of the location in the set.
+
+        Returns
+        -------
+        `lsst.ts.dateloc.ObservatoryLocation`
+            A new location instance with the information of the set.
+        """
+        return ObservatoryLocation(
+            float(self.latitude_rad[index]),
+            float(self.longitude_rad[index]),
+            float(self.height[index]),
+        )
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def utc_offset(self):
+        """Offsets of the local mean solar times from UTC.
+
+        Returns
+        -------
+        `numpy.ndarray`
+            The offsets (seconds), positive east of Greenwich.
+        """
+        return self.longitude_rad / (2.0 * math.pi) * 86400.0
+
+    def lst_rad(self, gmst_rad):
+        """Local Sidereal Times of all the locations.
+
+        The Greenwich Mean Sidereal Time only depends on the time, so it is
+        calculated once and offset by the longitude of each location.
+
+        Parameters
+        ----------
+        gmst_rad : `numpy.ndarray` or `float`
+            Greenwich Mean Sidereal Times (radians), in the range [0, 2 pi).
+
+        Returns
+        -------
+        `numpy.ndarray`
+            Local Sidereal Times (radians), with shape (N,) + the shape of the
+            sidereal times for N locations.
+        """
+        gmst_rad = np.asarray(gmst_rad, dtype=float)
+        longitude_rad = self.longitude_rad.reshape((-1,) + (1,) * gmst_rad.ndim)
+        lst_rad = gmst_rad + longitude_rad
+        lst_rad[lst_rad < 0.0] += 2.0 * math.pi
+        return lst_rad
+
+
+def _read_only(array):
+    """Make an array read-only.
+
+    Parameters
+    ----------
+    array : `numpy.ndarray`
+        The array, owning its data.
+
+    Returns
+    -------
+    `numpy.ndarray`
+        The same array, which can no longer be written.
+    """
+    array.flags.writeable = False
+    return array
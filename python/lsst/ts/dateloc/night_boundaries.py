@@ -0,0 +1,379 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import math
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+from . import nights
+from .date_profile import DateProfile
+from .ephemeris import sun_ra_dec
+
+__all__ = ["NightBoundaries", "NightEvents", "night_midnight"]
+
+NightEvents = namedtuple(
+    "NightEvents",
+    [
+        "midnight",
+        "local_midnight",
+        "sunset",
+        "sun_n06_setting",
+        "sun_n12_setting",
+        "sun_n18_setting",
+        "sun_n18_rising",
+        "sun_n12_rising",
+        "sun_n06_rising",
+        "sunrise",
+    ],
+)
+NightEvents.__doc__ = """Sun events of a night as UTC timestamps.
+
+Events that do not happen during the night, e.g. at high latitudes, are NaN.
+
+Parameters
+----------
+midnight : `float`
+    The UTC midnight identifying the night.
+local_midnight : `float`
+    The local mean solar midnight of the night.
+sunset : `float`
+    Sunset, with the upper limb of the Sun at the horizon.
+sun_n06_setting : `float`
+    End of the evening civil twilight, Sun 6 degrees below the horizon.
+sun_n12_setting : `float`
+    End of the evening nautical twilight, Sun 12 degrees below the horizon.
+sun_n18_setting : `float`
+    End of the evening astronomical twilight, Sun 18 degrees below the
+    horizon.
+sun_n18_rising : `float`
+    Start of the morning astronomical twilight.
+sun_n12_rising : `float`
+    Start of the morning nautical twilight.
+sun_n06_rising : `float`
+    Start of the morning civil twilight.
+sunrise : `float`
+    Sunrise, with the upper limb of the Sun at the horizon.
+"""
+
+
+def night_midnight(timestamps, utc_offset):
+    """UTC midnight identifying the night of the timestamps.
+
+    The night of a timestamp changes at local noon, as in
+    `lsst.ts.dateloc.night_index`, and is identified by the UTC midnight of
+    the UTC day holding its local midnight. An evening timestamp before
+    00:00 UTC west of Greenwich therefore belongs to the night of the next
+    UTC midnight.
+
+    Parameters
+    ----------
+    timestamps : `numpy.ndarray` or `float`
+        The UTC timestamps.
+    utc_offset : `float`
+        The offset (seconds) of the local mean solar time from UTC, e.g.
+        `lsst.ts.dateloc.ObservatoryLocation.utc_offset`.
+
+    Returns
+    -------
+    `numpy.ndarray` or `float`
+        The UTC midnights identifying the nights.
+    """
+    return nights.midnight_timestamp(
+        nights.local_midnight_timestamp(timestamps, utc_offset)
+    )
+
+
+def find_crossings(altitude_function, local_midnights, searches, grid_step, iterations):
+    """Find altitude crossings of a body within 12 hours of local midnights.
+
+    The altitude is first evaluated on a coarse grid for all the nights at
+    once, and every bracketed crossing is then refined by bisection.
+
+    Parameters
+    ----------
+    altitude_function : `callable`
+        Function returning the altitude (radians) of the body for an array
+        of UTC timestamps.
+    local_midnights : `numpy.ndarray`
+        The local midnights of the nights, a 1-D array.
+    searches : iterable of (`float`, `bool`, `bool`)
+        The crossings to find, each one as a tuple of the altitude
+        (degrees), True if the body sets through the altitude and True to
+        take the last crossing of the night instead of the first one.
+    grid_step : `float`
+        The spacing (seconds) of the coarse grid.
+    iterations : `int`
+        The number of bisections refining each crossing.
+
+    Returns
+    -------
+    `list` of `numpy.ndarray`
+        The UTC timestamps of the crossings of each search, with the shape
+        of the local midnights. Crossings that do not happen are NaN.
+    """
+    half_day = DateProfile.SECONDS_IN_DAY / 2.0
+    offsets = np.arange(-half_day, half_day + grid_step, grid_step)
+    grid = local_midnights[:, np.newaxis] + offsets
+    altitude = altitude_function(grid)
+    rows = np.arange(grid.shape[0])
+
+    crossings = []
+    for target_deg, setting, last in searches:
+        above = altitude >= math.radians(target_deg)
+        if setting:
+            crossing = above[:, :-1] & ~above[:, 1:]
+        else:
+            crossing = ~above[:, :-1] & above[:, 1:]
+        if last:
+            index = crossing.shape[1] - 1 - np.argmax(crossing[:, ::-1], axis=1)
+        else:
+            index = np.argmax(crossing, axis=1)
+        refined = _refine(
+            altitude_function,
+            grid[rows, index],
+            target_deg,
+            setting,
+            grid_step,
+            iterations,
+        )
+        crossings.append(np.where(crossing[rows, index], refined, np.nan))
+    return crossings
+
+
+def _refine(altitude_function, start, target_deg, setting, grid_step, iterations):
+    """Refine bracketed altitude crossings by bisection.
+
+    Parameters
+    ----------
+    altitude_function : `callable`
+        Function returning the altitude (radians) of the body for an array
+        of UTC timestamps.
+    start : `numpy.ndarray`
+        The UTC timestamps starting the brackets, which are one grid step
+        long.
+    target_deg : `float`
+        The altitude (degrees) of the event.
+    setting : `bool`
+        True if the body sets through the altitude within the brackets.
+    grid_step : `float`
+        The length (seconds) of the brackets.
+    iterations : `int`
+        The number of bisections.
+
+    Returns
+    -------
+    `numpy.ndarray`
+        The UTC timestamps of the crossings.
+    """
+    target = math.radians(target_deg)
+    low = start.copy()
+    high = start + grid_step
+    for _ in range(iterations):
+        middle = (low + high) / 2.0
+        before = (altitude_function(middle) >= target) == setting
+        low = np.where(before, middle, low)
+        high = np.where(before, high, middle)
+    return (low + high) / 2.0
+
+
+class NightBoundaries(object):
+    """This class finds the sunset, sunrise and twilight times of the nights
+    at a location.
+
+    A night is identified by a UTC midnight. It is the night whose local mean
+    solar midnight falls within the UTC day starting at that midnight, see
+    `night_midnight`. The events are searched for within 12 hours of the
+    local midnight.
+
+    The Sun altitude is first evaluated on a coarse grid for all the
+    requested nights at once, and every bracketed crossing is then refined
+    by bisection. The Sun position is accurate to 0.01 degrees, which gives
+    event times accurate to a few seconds at mid latitudes.
+
+    Parameters
+    ----------
+    location : `lsst.ts.dateloc.ObservatoryLocation`
+        The location site information instance.
+    cache_size : `int`, optional
+        The number of nights kept in the least recently used cache.
+    grid_step : `float`, optional
+        The spacing (seconds) of the coarse Sun altitude grid.
+    """
+
+    # Sun altitudes (degrees) for each event, in the order of NightEvents.
+    # The sunset and sunrise altitude accounts for the refraction and the
+    # semi-diameter of the Sun.
+    EVENT_ALTITUDES = (-0.833, -6.0, -12.0, -18.0, -18.0, -12.0, -6.0, -0.833)
+    EVENT_SETTING = (True, True, True, True, False, False, False, False)
+    BISECTION_ITERATIONS = 20
+
+    def __init__(self, location, cache_size=1024, grid_step=600.0):
+        self.cache_size = cache_size
+        self.grid_step = grid_step
+        self.location = location
+
+    @property
+    def location(self):
+        """The location site information instance.
+
+        Returns
+        -------
+        `lsst.ts.dateloc.ObservatoryLocation`
+            The location site information instance.
+        """
+        return self._location
+
+    @location.setter
+    def location(self, location):
+        self._location = location
+        self._date_profile = DateProfile(0.0, location)
+        # The cache key only holds the version of the location, which
+        # another location can share.
+        self._cache = OrderedDict()
+
+    def __call__(self, midnight):
+        """Get the events of one night, using the cache.
+
+        Parameters
+        ----------
+        midnight : `float`
+            The UTC midnight identifying the night.
+
+        Returns
+        -------
+        `NightEvents`
+            The events of the night.
+        """
+        key = self._cache_key(midnight)
+        try:
+            events = self._cache[key]
+        except KeyError:
+            events = NightEvents(
+                *(float(value) for value in self.compute_many(midnight))
+            )
+            self._cache[key] = events
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        return events
+
+    def _cache_key(self, midnight):
+        """Key of the cached events of a night.
+
+        Parameters
+        ----------
+        midnight : `float`
+            The UTC midnight identifying the night.
+
+        Returns
+        -------
+        `tuple`
+            The values the events of the night depend on.
+        """
+        return (midnight, self._location.version)
+
+    def for_date_profile(self, date_profile):
+        """Get the events of the night of a date profile.
+
+        Parameters
+        ----------
+        date_profile : `lsst.ts.dateloc.DateProfile`
+            The date profile. Its timestamp belongs to the night changing at
+            local noon, see `night_midnight`.
+
+        Returns
+        -------
+        `NightEvents`
+            The events of the night.
+        """
+        return self(night_midnight(date_profile.timestamp, self.location.utc_offset))
+
+    def local_midnight(self, midnight):
+        """Local mean solar midnight of a night.
+
+        Parameters
+        ----------
+        midnight : `numpy.ndarray` or `float`
+            The UTC midnight identifying the night.
+
+        Returns
+        -------
+        `numpy.ndarray` or `float`
+            The UTC timestamp of the local mean solar midnight.
+        """
+        return midnight + (-self.location.utc_offset % DateProfile.SECONDS_IN_DAY)
+
+    def sun_altitude(self, timestamps):
+        """Altitude of the Sun.
+
+        Parameters
+        ----------
+        timestamps : `numpy.ndarray`
+            The UTC timestamps.
+
+        Returns
+        -------
+        `numpy.ndarray`
+            The altitude (radians) of the center of the Sun, without
+            refraction.
+        """
+        mjd, lst_rad = self._date_profile.compute_many(timestamps)
+        ra, dec = sun_ra_dec(mjd)
+        sin_altitude = self.location.sin_latitude * np.sin(dec)
+        sin_altitude += self.location.cos_latitude * np.cos(dec) * np.cos(lst_rad - ra)
+        return np.arcsin(np.clip(sin_altitude, -1.0, 1.0))
+
+    def compute_many(self, midnights):
+        """Compute the events of many nights without using the cache.
+
+        Parameters
+        ----------
+        midnights : `numpy.ndarray` or `float`
+            The UTC midnights identifying the nights.
+
+        Returns
+        -------
+        `NightEvents`
+            The events of the nights, each one an array with the shape of the
+            midnights.
+        """
+        midnights = np.asarray(midnights, dtype=float)
+        local_midnights = self.local_midnight(midnights.ravel())
+        # The first setting and the last rising crossings of the night.
+        searches = [
+            (target_deg, setting, not setting)
+            for target_deg, setting in zip(self.EVENT_ALTITUDES, self.EVENT_SETTING)
+        ]
+        events = find_crossings(
+            self.sun_altitude,
+            local_midnights,
+            searches,
+            self.grid_step,
+            self.BISECTION_ITERATIONS,
+        )
+
+        shape = midnights.shape
+        return NightEvents(
+            midnights,
+            local_midnights.reshape(shape),
+            *(event.reshape(shape) for event in events),
+        )
@@ -0,0 +1,244 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import numpy as np
+
+from .night_boundaries import NightEvents
+from .nights import SECONDS_IN_DAY
+
+__all__ = ["NightCache"]
+
+
+class NightCache(object):
+    """This class stores per-night values in a SQLite database, so they are
+    kept between runs.
+
+    The values are keyed by the `ObservatoryLocation.site_hash` of the
+    location, the night and the name of the quantity. A night is the number
+    of days from 1970-01-01 to the UTC midnight identifying it, as used by
+    `NightBoundaries`. When the cache holds more than ``max_entries`` values
+    the least recently used ones are removed. The size of the cache is
+    bounded by the number of values, not by the size of the file.
+
+    Parameters
+    ----------
+    filename : `str`
+        The name of the database file, created if needed.
+    max_entries : `int`, optional
+        The maximum number of values kept, each one a quantity of a night.
+    """
+
+    def __init__(self, filename, max_entries=1000000):
+        self.filename = filename
+        self.max_entries = max_entries
+        # Imported here, since sqlite3 is slow to import.
+        import sqlite3
+
+        self._connection = sqlite3.connect(filename)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS night_values ("
+                "site TEXT NOT NULL, quantity TEXT NOT NULL, night INTEGER NOT NULL, "
+                "value REAL, used INTEGER NOT NULL, "
+                "PRIMARY KEY (site, quantity, night))"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS night_values_used ON night_values (used)"
+            )
+        # Counter of the cache accesses, ordering the values by last use.
+        (self._clock,) = self._connection.execute(
+            "SELECT COALESCE(MAX(used), 0) FROM night_values"
+        ).fetchone()
+
+    def __len__(self):
+        (count,) = self._connection.execute(
+            "SELECT COUNT(*) FROM night_values"
+        ).fetchone()
+        return count
+
+    def close(self):
+        """Close the database."""
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def get(self, location, nights, quantity):
+        """Get cached values.
+
+        Parameters
+        ----------
+        location : `lsst.ts.dateloc.ObservatoryLocation`
+            The location of the values.
+        nights : `numpy.ndarray`
+            The nights (integer days from 1970-01-01) of the values.
+        quantity : `str`
+            The name of the quantity.
+
+        Returns
+        -------
+        values : `numpy.ndarray`
+            The values, NaN where they are not cached.
+        found : `numpy.ndarray`
+            True where the values are cached.
+        """
+        nights = np.asarray(nights, dtype=np.int64)
+        values = np.full(nights.shape, np.nan)
+        found = np.zeros(nights.shape, dtype=bool)
+        if nights.size == 0:
+            return (values, found)
+        key = (location.site_hash, quantity, int(nights.min()), int(nights.max()))
+        rows = self._connection.execute(
+            "SELECT night, value FROM night_values "
+            "WHERE site = ? AND quantity = ? AND night BETWEEN ? AND ?",
+            key,
+        ).fetchall()
+        if not rows:
+            return (values, found)
+        cached_nights = np.array([row[0] for row in rows], dtype=np.int64)
+        cached_values = np.array(
+            [np.nan if row[1] is None else row[1] for row in rows], dtype=float
+        )
+        order = np.argsort(cached_nights)
+        cached_nights = cached_nights[order]
+        index = np.minimum(
+            np.searchsorted(cached_nights, nights), cached_nights.size - 1
+        )
+        found = cached_nights[index] == nights
+        values[found] = cached_values[order][index[found]]
+
+        # Only the requested values are marked as used.
+        self._clock += 1
+        site_hash = location.site_hash
+        with self._connection:
+            self._connection.executemany(
+                "UPDATE night_values SET used = ? "
+                "WHERE site = ? AND quantity = ? AND night = ?",
+                (
+                    (self._clock, site_hash, quantity, night)
+                    for night in np.unique(nights[found]).tolist()
+                ),
+            )
+        return (values, found)
+
+    def put(self, location, nights, quantity, values):
+        """Store values, replacing the ones already cached.
+
+        Parameters
+        ----------
+        location : `lsst.ts.dateloc.ObservatoryLocation`
+            The location of the values.
+        nights : `numpy.ndarray`
+            The nights (integer days from 1970-01-01) of the values.
+        quantity : `str`
+            The name of the quantity.
+        values : `numpy.ndarray`
+            The values. NaN values are cached as well.
+        """
+        nights = np.asarray(nights, dtype=np.int64).ravel()
+        values = np.broadcast_to(np.asarray(values, dtype=float), nights.shape)
+        site_hash = location.site_hash
+        self._clock += 1
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO night_values VALUES (?, ?, ?, ?, ?)",
+                (
+                    (
+                        site_hash,
+                        quantity,
+                        night,
+                        None if np.isnan(value) else value,
+                        self._clock,
+                    )
+                    for (night, value) in zip(nights.tolist(), values.tolist())
+                ),
+            )
+            self._evict()
+
+    def _evict(self):
+        """Remove the least recently used values above ``max_entries``."""
+        excess = len(self) - self.max_entries
+        if excess > 0:
+            self._connection.execute(
+                "DELETE FROM night_values WHERE rowid IN "
+                "(SELECT rowid FROM night_values ORDER BY used LIMIT ?)",
+                (excess,),
+            )
+
+    def get_or_compute(self, location, nights, quantity, function):
+        """Get cached values, calculating and storing the missing ones.
+
+        Parameters
+        ----------
+        location : `lsst.ts.dateloc.ObservatoryLocation`
+            The location of the values.
+        nights : `numpy.ndarray`
+            The nights (integer days from 1970-01-01) of the values.
+        quantity : `str`
+            The name of the quantity.
+        function : `callable`
+            The function calculating the values from an array of nights.
+
+        Returns
+        -------
+        `numpy.ndarray`
+            The values.
+        """
+        values, found = self.get(location, nights, quantity)
+        if not found.all():
+            missing = np.asarray(nights, dtype=np.int64)[~found]
+            values[~found] = function(missing)
+            self.put(location, missing, quantity, values[~found])
+        return values
+
+    def night_events(self, night_boundaries, midnights):
+        """Get the events of nights, calculating the missing ones.
+
+        Parameters
+        ----------
+        night_boundaries : `lsst.ts.dateloc.NightBoundaries`
+            The calculator of the events, giving the location.
+        midnights : `numpy.ndarray`
+            The UTC midnights identifying the nights.
+
+        Returns
+        -------
+        `lsst.ts.dateloc.NightEvents`
+            The events of the nights, each one an array with the shape of the
+            midnights.
+        """
+        location = night_boundaries.location
+        midnights = np.asarray(midnights, dtype=float)
+        nights = np.floor(midnights.ravel() / SECONDS_IN_DAY).astype(np.int64)
+        names = NightEvents._fields[1:]
+        cached = [self.get(location, nights, name) for name in names]
+        missing = ~np.logical_and.reduce([found for (_, found) in cached])
+        events = [values for (values, _) in cached]
+        if missing.any():
+            computed = night_boundaries.compute_many(nights[missing] * SECONDS_IN_DAY)
+            for values, name in zip(events, names):
+                values[missing] = getattr(computed, name)
+                self.put(location, nights[missing], name, values[missing])
+        return NightEvents(
+            midnights, *(values.reshape(midnights.shape) for values in events)
+        )
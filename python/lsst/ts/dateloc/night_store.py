@@ -0,0 +1,296 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import math
+
+import numpy as np
+
+from .date_profile import DateProfile
+from .ephemeris import BodyEphemeris
+from .night_boundaries import (
+    NightBoundaries,
+    NightEvents,
+    find_crossings,
+    night_midnight,
+)
+
+__all__ = ["NightEphemerisStore"]
+
+
+class NightEphemerisStore(object):
+    """This class precomputes a record per night over a long span, and
+    looks up the record of a night in constant time.
+
+    A night is identified by its UTC midnight, as in `NightBoundaries`, and
+    is numbered by the days from 1970-01-01 to that midnight. The records
+    hold the `NightEvents` of the night, the Local Sidereal Times at dusk
+    and dawn, the moonrise and moonset and the Moon phase. Dusk and dawn are
+    the end and start of the nautical twilight, with the Sun 12 degrees
+    below the horizon. The moonrise and moonset are the first ones within
+    12 hours of the local midnight, with the upper limb of the Moon at the
+    horizon. Events that do not happen are NaN.
+
+    The records are kept in a structured array, which can be saved to a
+    ``.npy`` file and memory-mapped by later runs.
+
+    Parameters
+    ----------
+    location : `lsst.ts.dateloc.ObservatoryLocation`
+        The location site information instance.
+    start_timestamp : `float`
+        A UTC timestamp in the UTC day of the first night.
+    stop_timestamp : `float`
+        A UTC timestamp in the UTC day of the last night.
+    grid_step : `float`, optional
+        The spacing (seconds) of the coarse grids used to find the events.
+    chunk_size : `int`, optional
+        The number of nights calculated at a time.
+    """
+
+    DTYPE = np.dtype(
+        [(name, np.float64) for name in NightEvents._fields]
+        + [
+            ("lst_dusk", np.float64),
+            ("lst_dawn", np.float64),
+            ("moonrise", np.float64),
+            ("moonset", np.float64),
+            ("moon_phase", np.float64),
+        ]
+    )
+    # Altitude (degrees) of the center of the Moon at moonrise and moonset,
+    # accounting for the refraction and the semi-diameter of the Moon.
+    MOON_HORIZON = -0.833
+    BISECTION_ITERATIONS = 20
+
+    def __init__(
+        self, location, start_timestamp, stop_timestamp, grid_step=600.0, chunk_size=366
+    ):
+        first_night = int(math.floor(start_timestamp / DateProfile.SECONDS_IN_DAY))
+        last_night = int(math.floor(stop_timestamp / DateProfile.SECONDS_IN_DAY))
+        nights = np.arange(first_night, max(last_night + 1, first_night))
+        records = np.empty(nights.size, dtype=self.DTYPE)
+        calculator = _NightCalculator(location, grid_step, self.BISECTION_ITERATIONS)
+        for first in range(0, nights.size, chunk_size):
+            chunk = records[first : first + chunk_size]
+            midnights = nights[first : first + chunk_size] * DateProfile.SECONDS_IN_DAY
+            calculator.fill(chunk, midnights, self.MOON_HORIZON)
+        self._set_records(location, records)
+
+    def _set_records(self, location, records):
+        """Set the store contents.
+
+        Parameters
+        ----------
+        location : `lsst.ts.dateloc.ObservatoryLocation`
+            The location site information instance.
+        records : `numpy.ndarray`
+            The records of consecutive nights.
+
+        Raises
+        ------
+        ValueError
+            If the records are not night records, or were calculated for a
+            location with a different longitude.
+        """
+        if records.dtype != self.DTYPE or records.ndim != 1:
+            raise ValueError("Data does not hold night records.")
+        if records.size > 0:
+            offset = -location.utc_offset % DateProfile.SECONDS_IN_DAY
+            local_offset = records[0]["local_midnight"] - records[0]["midnight"]
+            if not math.isclose(local_offset, offset, abs_tol=1e-6):
+                raise ValueError("The night records belong to another location.")
+            self.first_night = int(records[0]["midnight"] // DateProfile.SECONDS_IN_DAY)
+        else:
+            self.first_night = 0
+        self.location = location
+        self.records = records
+
+    @classmethod
+    def load(cls, filename, location, mmap_mode="r"):
+        """Load a store written with `save`.
+
+        Parameters
+        ----------
+        filename : `str` or `pathlib.Path`
+            The ``.npy`` file holding the records.
+        location : `lsst.ts.dateloc.ObservatoryLocation`
+            The location the records were calculated for. Only its
+            longitude is checked.
+        mmap_mode : `str` or `None`, optional
+            Memory mapping mode passed to `numpy.load`. The default maps the
+            file read-only, so several processes share the same pages.
+
+        Returns
+        -------
+        `NightEphemerisStore`
+            The loaded store.
+
+        Raises
+        ------
+        ValueError
+            If the file does not hold night records of the location.
+        """
+        store = cls.__new__(cls)
+        store._set_records(location, np.load(filename, mmap_mode=mmap_mode))
+        return store
+
+    def save(self, filename):
+        """Write the records to a ``.npy`` file.
+
+        Parameters
+        ----------
+        filename : `str` or `pathlib.Path`
+            The file to write.
+        """
+        np.save(filename, np.asarray(self.records))
+
+    def __len__(self):
+        return self.records.size
+
+    def night(self, night):
+        """Get the record of a night.
+
+        Parameters
+        ----------
+        night : `int`
+            The night, as days from 1970-01-01 to its UTC midnight.
+
+        Returns
+        -------
+        `numpy.void`
+            The record, whose fields are read by name.
+
+        Raises
+        ------
+        ValueError
+            If the night is not in the store.
+        """
+        index = night - self.first_night
+        if not 0 <= index < self.records.size:
+            raise ValueError(f"Night {night} is not in the store.")
+        return self.records[index]
+
+    def for_midnight(self, midnight):
+        """Get the record of the night identified by a UTC midnight.
+
+        Parameters
+        ----------
+        midnight : `float`
+            The UTC midnight identifying the night.
+
+        Returns
+        -------
+        `numpy.void`
+            The record, whose fields are read by name.
+
+        Raises
+        ------
+        ValueError
+            If the night is not in the store.
+        """
+        return self.night(int(midnight // DateProfile.SECONDS_IN_DAY))
+
+    def for_date_profile(self, date_profile):
+        """Get the record of the night of a date profile.
+
+        Parameters
+        ----------
+        date_profile : `lsst.ts.dateloc.DateProfile`
+            The date profile. Its timestamp belongs to the night changing at
+            local noon, as with `NightBoundaries.for_date_profile`.
+
+        Returns
+        -------
+        `numpy.void`
+            The record, whose fields are read by name.
+
+        Raises
+        ------
+        ValueError
+            If the night is not in the store.
+        """
+        midnight = night_midnight(date_profile.timestamp, self.location.utc_offset)
+        return self.for_midnight(midnight)
+
+
+class _NightCalculator(object):
+    """Calculator of the night records.
+
+    Parameters
+    ----------
+    location : `lsst.ts.dateloc.ObservatoryLocation`
+        The location site information instance.
+    grid_step : `float`
+        The spacing (seconds) of the coarse grids used to find the events.
+    bisection_iterations : `int`
+        The number of bisections refining the moonrise and moonset.
+    """
+
+    def __init__(self, location, grid_step, bisection_iterations):
+        self.grid_step = grid_step
+        self.bisection_iterations = bisection_iterations
+        self.night_boundaries = NightBoundaries(location, grid_step=grid_step)
+        self.date_profile = DateProfile(0.0, location)
+        self.ephemeris = BodyEphemeris(self.date_profile)
+
+    def fill(self, records, midnights, moon_horizon):
+        """Calculate the records of nights.
+
+        Parameters
+        ----------
+        records : `numpy.ndarray`
+            The records to fill.
+        midnights : `numpy.ndarray`
+            The UTC midnights identifying the nights.
+        moon_horizon : `float`
+            The altitude (degrees) of the Moon at moonrise and moonset.
+        """
+        events = self.night_boundaries.compute_many(midnights)
+        for name, values in zip(events._fields, events):
+            records[name] = values
+        _, records["lst_dusk"] = self.date_profile.compute_many(events.sun_n12_setting)
+        _, records["lst_dawn"] = self.date_profile.compute_many(events.sun_n12_rising)
+        records["moon_phase"] = self.ephemeris.compute_many(
+            events.local_midnight
+        ).moon_phase
+
+        # The first moonrise and moonset of the night.
+        records["moonrise"], records["moonset"] = find_crossings(
+            self._moon_altitude,
+            events.local_midnight,
+            [(moon_horizon, False, False), (moon_horizon, True, False)],
+            self.grid_step,
+            self.bisection_iterations,
+        )
+
+    def _moon_altitude(self, timestamps):
+        """Altitude of the Moon.
+
+        Parameters
+        ----------
+        timestamps : `numpy.ndarray`
+            The UTC timestamps.
+
+        Returns
+        -------
+        `numpy.ndarray`
+            The topocentric altitude (radians) of the center of the Moon.
+        """
+        return self.ephemeris.compute_many(timestamps).moon_alt
@@ -0,0 +1,128 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import numpy as np
+
+__all__ = ["midnight_timestamp", "local_midnight_timestamp", "night_index", "dayobs"]
+
+SECONDS_IN_DAY = 86400.0
+
+
+def _as_output(value):
+    """Convert zero dimensional results to Python scalars.
+
+    Parameters
+    ----------
+    value : `numpy.ndarray`
+        The result.
+
+    Returns
+    -------
+    `numpy.ndarray`, `float` or `int`
+        The result, as a scalar if it has no dimensions.
+    """
+    return value if value.ndim else value.item()
+
+
+def midnight_timestamp(timestamps):
+    """UTC midnight of the UTC day of the timestamps.
+
+    Parameters
+    ----------
+    timestamps : `numpy.ndarray` or `float`
+        The UTC timestamps.
+
+    Returns
+    -------
+    `numpy.ndarray` or `float`
+        The UTC timestamps of the midnights.
+    """
+    timestamps = np.asarray(timestamps, dtype=float)
+    return _as_output(np.floor(timestamps / SECONDS_IN_DAY) * SECONDS_IN_DAY)
+
+
+def night_index(timestamps, utc_offset):
+    """Night of the timestamps, as a day number.
+
+    A night is labelled with the local date of its evening, and changes at
+    local noon. With a ``utc_offset`` of zero this is the Rubin Observatory
+    DAYOBS convention, which changes date at 12:00 UTC.
+
+    Parameters
+    ----------
+    timestamps : `numpy.ndarray` or `float`
+        The UTC timestamps.
+    utc_offset : `float`
+        The offset (seconds) of the local time from UTC, e.g.
+        `lsst.ts.dateloc.ObservatoryLocation.utc_offset`.
+
+    Returns
+    -------
+    `numpy.ndarray` or `int`
+        The number of days from 1970-01-01 to the local date of the evening
+        of the night.
+    """
+    timestamps = np.asarray(timestamps, dtype=float)
+    local_days = (timestamps + utc_offset) / SECONDS_IN_DAY - 0.5
+    return _as_output(np.floor(local_days).astype(np.int64))
+
+
+def local_midnight_timestamp(timestamps, utc_offset):
+    """Local midnight of the night of the timestamps.
+
+    Parameters
+    ----------
+    timestamps : `numpy.ndarray` or `float`
+        The UTC timestamps.
+    utc_offset : `float`
+        The offset (seconds) of the local time from UTC.
+
+    Returns
+    -------
+    `numpy.ndarray` or `float`
+        The UTC timestamps of the local midnights in the middle of the
+        nights given by `night_index`.
+    """
+    nights = np.asarray(night_index(timestamps, utc_offset))
+    return _as_output((nights + 1) * SECONDS_IN_DAY - utc_offset)
+
+
+def dayobs(timestamps, utc_offset):
+    """Night of the timestamps, as a YYYYMMDD integer.
+
+    Parameters
+    ----------
+    timestamps : `numpy.ndarray` or `float`
+        The UTC timestamps.
+    utc_offset : `float`
+        The offset (seconds) of the local time from UTC.
+
+    Returns
+    -------
+    `numpy.ndarray` or `int`
+        The local date of the evening of the nights given by `night_index`.
+    """
+    dates = np.asarray(night_index(timestamps, utc_offset)).astype("datetime64[D]")
+    years = dates.astype("datetime64[Y]")
+    months = dates.astype("datetime64[M]")
+    days = (dates - months).astype(np.int64) + 1
+    month_numbers = (months - years).astype(np.int64) + 1
+    year_numbers = years.astype(np.int64) + 1970
+    return _as_output(year_numbers * 10000 + month_numbers * 100 + days)
@@ -0,0 +1,108 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import math
+
+import numpy as np
+
+__all__ = ["compute_range_parallel"]
+
+
+def _compute_chunk(date_profile, filename, start, step, first, last):
+    """Calculate one chunk of `compute_range_parallel` in a worker.
+
+    Parameters
+    ----------
+    date_profile : `lsst.ts.dateloc.DateProfile`
+        The date profile doing the calculation.
+    filename : `str`
+        The output ``.npy`` file.
+    start : `float`
+        The first UTC timestamp of the range.
+    step : `float`
+        The spacing (seconds) of the timestamps.
+    first : `int`
+        The index of the first timestamp of the chunk.
+    last : `int`
+        The index after the last timestamp of the chunk.
+    """
+    output = np.load(filename, mmap_mode="r+")
+    timestamps = start + np.arange(first, last) * step
+    output[0, first:last], output[1, first:last] = date_profile.compute_many(timestamps)
+    output.flush()
+
+
+def compute_range_parallel(
+    date_profile, start, stop, step, filename, max_workers=None, chunk_size=1000000
+):
+    """Calculate the MJD and LST of evenly spaced timestamps in parallel.
+
+    The range is split in chunks that are calculated by a pool of processes
+    with `DateProfile.compute_many`. The workers write the values directly
+    into a memory-mapped ``.npy`` file, so the results are never sent back
+    between the processes.
+
+    Parameters
+    ----------
+    date_profile : `lsst.ts.dateloc.DateProfile`
+        The date profile giving the location and the MJD calculation. Its
+        internal timestamp is not changed.
+    start : `float`
+        The first UTC timestamp.
+    stop : `float`
+        The end of the range (excluded) as a UTC timestamp.
+    step : `float`
+        The spacing (seconds) of the timestamps.
+    filename : `str`
+        The output ``.npy`` file, holding an array of shape (2, N) with the
+        Modified Julian Dates and the Local Sidereal Times (radians).
+    max_workers : `int`, optional
+        The number of processes. The number of CPUs is used if not given.
+        With one worker the chunks are calculated in the calling process.
+    chunk_size : `int`, optional
+        The number of timestamps calculated by a worker at a time.
+
+    Returns
+    -------
+    (`numpy.memmap`, `numpy.memmap`)
+        Read-only memory-mapped arrays of the Modified Julian Dates and the
+        Local Sidereal Times (radians).
+    """
+    size = max(int(math.ceil((stop - start) / step)), 0)
+    output = np.lib.format.open_memmap(
+        filename, mode="w+", dtype=np.float64, shape=(2, size)
+    )
+    del output
+    chunks = [
+        (date_profile, filename, start, step, first, min(first + chunk_size, size))
+        for first in range(0, size, chunk_size)
+    ]
+    if max_workers == 1:
+        for chunk in chunks:
+            _compute_chunk(*chunk)
+    else:
+        # Imported here, since concurrent.futures.process is slow to import.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for future in [executor.submit(_compute_chunk, *chunk) for chunk in chunks]:
+                future.result()
+    output = np.load(filename, mmap_mode="r")
+    return (output[0], output[1])
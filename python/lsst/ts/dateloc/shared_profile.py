@@ -0,0 +1,141 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import threading
+
+from .date_profile import DateProfile
+
+__all__ = ["SharedDateProfile"]
+
+
+class SharedDateProfile(object):
+    """This class shares the current date information between threads.
+
+    Every `update` calculates a complete `DateSnapshot` and then replaces the
+    current one with a single attribute assignment, which is atomic. Readers
+    take `snapshot` without any lock and always get the values of a single
+    timestamp, even while another thread updates. Updates are serialized by
+    a lock, so several threads can also update.
+
+    Parameters
+    ----------
+    timestamp : `float`
+        The UTC timestamp for a given date/time.
+    location : `lsst.ts.dateloc.ObservatoryLocation`
+        The location site information instance.
+    legacy_mjd : `bool`, optional
+        The MJD calculation of the underlying `DateProfile`.
+    dut1_table : `lsst.ts.dateloc.Dut1Table`, optional
+        The table of UT1-UTC of the underlying `DateProfile`.
+
+    Notes
+    -----
+    The snapshots are calculated on `update`, so a change of the location
+    only shows in the snapshots of later updates.
+    """
+
+    __slots__ = ("_date_profile", "_lock", "_snapshot")
+
+    def __init__(self, timestamp, location, legacy_mjd=False, dut1_table=None):
+        self._date_profile = DateProfile(
+            timestamp, location, legacy_mjd=legacy_mjd, dut1_table=dut1_table
+        )
+        self._lock = threading.Lock()
+        self._snapshot = self._date_profile.snapshot()
+
+    @property
+    def location(self):
+        """The location site information instance.
+
+        Returns
+        -------
+        `lsst.ts.dateloc.ObservatoryLocation`
+            The location site information instance.
+        """
+        return self._date_profile.location
+
+    @property
+    def snapshot(self):
+        """The current date information.
+
+        Read it once and use its fields, since two reads can give the
+        snapshots of different updates.
+
+        Returns
+        -------
+        `lsst.ts.dateloc.DateSnapshot`
+            The timestamp, MJD, LST and midnights of the last update.
+        """
+        return self._snapshot
+
+    def update(self, timestamp):
+        """Change the current date information.
+
+        Parameters
+        ----------
+        timestamp : `float`
+            The new UTC timestamp.
+
+        Returns
+        -------
+        `lsst.ts.dateloc.DateSnapshot`
+            The timestamp, MJD, LST and midnights for the timestamp.
+        """
+        with self._lock:
+            self._date_profile.update(timestamp)
+            snapshot = self._date_profile.snapshot()
+            self._snapshot = snapshot
+        return snapshot
+
+    def __call__(self, timestamp):
+        """Change the current date information.
+
+        This is the same as `update`.
+
+        Parameters
+        ----------
+        timestamp : `float`
+            The new UTC timestamp.
+
+        Returns
+        -------
+        `lsst.ts.dateloc.DateSnapshot`
+            The timestamp, MJD, LST and midnights for the timestamp.
+        """
+        return self.update(timestamp)
+
+    def compute_many(self, timestamps):
+        """Modified Julian Date and Local Sidereal Time for many timestamps.
+
+        This does not change the current date information and can be called
+        from any thread.
+
+        Parameters
+        ----------
+        timestamps : `numpy.ndarray` or `float`
+            The UTC timestamps to get the MJD and LST for.
+
+        Returns
+        -------
+        (`numpy.ndarray`, `numpy.ndarray`)
+            A tuple of the Modified Julian Dates and Local Sidereal Times
+            (radians), with the same shape as the input timestamps.
+        """
+        return self._date_profile.compute_many(timestamps)
@@ -0,0 +1,210 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import numpy as np
+
+from .date_profile import DateProfile
+from .nights import SECONDS_IN_DAY, _as_output
+
+__all__ = ["TT_MINUS_TAI", "Dut1Table", "tai_utc", "utc_to_tai", "utc_to_tt"]
+
+# Offset (seconds) of Terrestrial Time from International Atomic Time.
+TT_MINUS_TAI = 32.184
+
+# UTC dates (MJD) from which each value of TAI-UTC (seconds) applies, from
+# the IERS Bulletin C. It has to be extended when a leap second is
+# announced.
+LEAP_SECONDS = (
+    (41317, 10.0),
+    (41499, 11.0),
+    (41683, 12.0),
+    (42048, 13.0),
+    (42413, 14.0),
+    (42778, 15.0),
+    (43144, 16.0),
+    (43509, 17.0),
+    (43874, 18.0),
+    (44239, 19.0),
+    (44786, 20.0),
+    (45151, 21.0),
+    (45516, 22.0),
+    (46247, 23.0),
+    (47161, 24.0),
+    (47892, 25.0),
+    (48257, 26.0),
+    (48804, 27.0),
+    (49169, 28.0),
+    (49534, 29.0),
+    (50083, 30.0),
+    (50630, 31.0),
+    (51179, 32.0),
+    (53736, 33.0),
+    (54832, 34.0),
+    (56109, 35.0),
+    (57204, 36.0),
+    (57754, 37.0),
+)
+
+# The leap second table as sorted arrays of UTC timestamps and TAI-UTC.
+_LEAP_TIMESTAMPS = np.array(
+    [(mjd - DateProfile.MJD_UNIX_EPOCH) * SECONDS_IN_DAY for (mjd, _) in LEAP_SECONDS]
+)
+_TAI_UTC = np.array([value for (_, value) in LEAP_SECONDS])
+
+
+def tai_utc(timestamps):
+    """Difference between International Atomic Time and UTC.
+
+    Parameters
+    ----------
+    timestamps : `numpy.ndarray` or `float`
+        The UTC timestamps. Dates before 1972, when UTC did not use leap
+        seconds, get the 1972 value.
+
+    Returns
+    -------
+    `numpy.ndarray` or `float`
+        TAI-UTC (seconds).
+    """
+    index = np.searchsorted(_LEAP_TIMESTAMPS, timestamps, side="right") - 1
+    return _as_output(_TAI_UTC[np.maximum(index, 0)])
+
+
+def utc_to_tai(timestamps):
+    """Convert UTC timestamps to International Atomic Time.
+
+    Parameters
+    ----------
+    timestamps : `numpy.ndarray` or `float`
+        The UTC timestamps.
+
+    Returns
+    -------
+    `numpy.ndarray` or `float`
+        The timestamps (seconds from 1970-01-01 0h) on the TAI scale.
+    """
+    return _as_output(np.asarray(timestamps, dtype=float) + tai_utc(timestamps))
+
+
+def utc_to_tt(timestamps):
+    """Convert UTC timestamps to Terrestrial Time.
+
+    Parameters
+    ----------
+    timestamps : `numpy.ndarray` or `float`
+        The UTC timestamps.
+
+    Returns
+    -------
+    `numpy.ndarray` or `float`
+        The timestamps (seconds from 1970-01-01 0h) on the TT scale.
+    """
+    return _as_output(np.asarray(utc_to_tai(timestamps)) + TT_MINUS_TAI)
+
+
+class Dut1Table(object):
+    """This class gives the difference between UT1 and UTC from a table of
+    daily values.
+
+    The values are interpolated linearly as UT1-TAI, which has no jumps at
+    the leap seconds. Dates outside the table get the first or last value.
+
+    Parameters
+    ----------
+    mjd : `numpy.ndarray`
+        The UTC Modified Julian Dates of the values, in increasing order.
+    ut1_utc : `numpy.ndarray`
+        The values of UT1-UTC (seconds).
+    """
+
+    # Columns (zero based, end excluded) of the MJD and of UT1-UTC in the
+    # IERS finals2000A files.
+    FINALS_MJD_COLUMNS = (7, 15)
+    FINALS_UT1_UTC_COLUMNS = (58, 68)
+
+    def __init__(self, mjd, ut1_utc):
+        mjd = np.asarray(mjd, dtype=float)
+        if mjd.size == 0:
+            raise ValueError("The DUT1 table is empty.")
+        self.timestamps = (mjd - DateProfile.MJD_UNIX_EPOCH) * SECONDS_IN_DAY
+        self.ut1_tai = np.asarray(ut1_utc, dtype=float) - tai_utc(self.timestamps)
+
+    @classmethod
+    def from_finals(cls, filename):
+        """Load the table from an IERS finals2000A file.
+
+        Only the days with a UT1-UTC value, measured or predicted, are
+        used. The file is read locally, it is never downloaded.
+
+        Parameters
+        ----------
+        filename : `str`
+            The name of the file, e.g. a copy of
+            https://datacenter.iers.org/data/9/finals2000A.all.
+
+        Returns
+        -------
+        `Dut1Table`
+            The table.
+        """
+        mjd_start, mjd_end = cls.FINALS_MJD_COLUMNS
+        ut1_start, ut1_end = cls.FINALS_UT1_UTC_COLUMNS
+        mjd = []
+        ut1_utc = []
+        with open(filename) as finals_file:
+            for line in finals_file:
+                value = line[ut1_start:ut1_end].strip()
+                if value:
+                    mjd.append(float(line[mjd_start:mjd_end]))
+                    ut1_utc.append(float(value))
+        return cls(mjd, ut1_utc)
+
+    def ut1_utc(self, timestamps):
+        """Difference between UT1 and UTC.
+
+        Parameters
+        ----------
+        timestamps : `numpy.ndarray` or `float`
+            The UTC timestamps.
+
+        Returns
+        -------
+        `numpy.ndarray` or `float`
+            UT1-UTC (seconds).
+        """
+        ut1_tai = np.interp(timestamps, self.timestamps, self.ut1_tai)
+        return _as_output(ut1_tai + tai_utc(timestamps))
+
+    def utc_to_ut1(self, timestamps):
+        """Convert UTC timestamps to UT1.
+
+        Parameters
+        ----------
+        timestamps : `numpy.ndarray` or `float`
+            The UTC timestamps.
+
+        Returns
+        -------
+        `numpy.ndarray` or `float`
+            The timestamps (seconds from 1970-01-01 0h) on the UT1 scale.
+        """
+        return _as_output(
+            np.asarray(timestamps, dtype=float) + self.ut1_utc(timestamps)
+        )
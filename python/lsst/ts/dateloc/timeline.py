@@ -0,0 +1,269 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import contextlib
+import math
+import os
+import shutil
+import struct
+import tempfile
+import zipfile
+from collections import namedtuple
+
+import numpy as np
+
+from . import nights
+
+__all__ = ["Timeline", "write_timeline", "load_timeline"]
+
+Timeline = namedtuple(
+    "Timeline",
+    ["timestamp", "mjd", "lst_rad", "night_index", "midnight", "local_midnight"],
+)
+Timeline.__doc__ = """Columns of a timeline of evenly spaced timestamps.
+
+Parameters
+----------
+timestamp : `numpy.ndarray`
+    The UTC timestamps.
+mjd : `numpy.ndarray`
+    The Modified Julian Dates.
+lst_rad : `numpy.ndarray`
+    The Local Sidereal Times (radians).
+night_index : `numpy.ndarray`
+    The nights, as given by `lsst.ts.dateloc.night_index`.
+midnight : `numpy.ndarray`
+    The UTC midnights of the UTC days of the timestamps.
+local_midnight : `numpy.ndarray`
+    The local midnights of the nights.
+"""
+
+# Size of the fixed part of the local file headers of zip files, and
+# position in it of the file name and extra field lengths.
+_ZIP_LOCAL_HEADER_SIZE = 30
+_ZIP_LOCAL_HEADER_LENGTHS = 26
+# Data types of the timeline columns.
+_COLUMN_DTYPES = Timeline(
+    np.float64, np.float64, np.float64, np.int64, np.float64, np.float64
+)
+
+
+def _timeline_chunk(date_profile, utc_offset, timestamps):
+    """Calculate the timeline columns of a chunk of timestamps.
+
+    Parameters
+    ----------
+    date_profile : `lsst.ts.dateloc.DateProfile`
+        The date profile doing the calculation.
+    utc_offset : `float`
+        The offset (seconds) of the local time from UTC.
+    timestamps : `numpy.ndarray`
+        The UTC timestamps of the chunk.
+
+    Returns
+    -------
+    `Timeline`
+        The columns of the chunk.
+    """
+    mjd, lst_rad = date_profile.compute_many(timestamps)
+    columns = Timeline(
+        timestamps,
+        mjd,
+        lst_rad,
+        nights.night_index(timestamps, utc_offset),
+        nights.midnight_timestamp(timestamps),
+        nights.local_midnight_timestamp(timestamps, utc_offset),
+    )
+    return Timeline(
+        *(
+            np.asarray(values, dtype=dtype)
+            for values, dtype in zip(columns, _COLUMN_DTYPES)
+        )
+    )
+
+
+def write_timeline(
+    filename, date_profile, start, stop, step, chunk_size=100000, utc_offset=None
+):
+    """Write the timeline of evenly spaced timestamps to a columnar file.
+
+    The values are calculated and written in chunks, so the timeline never
+    has to fit in memory. Files ending in ``.parquet`` are written with
+    pyarrow, with one row group per chunk. Other files are written as
+    uncompressed ``.npz`` files, with one ``.npy`` member per column.
+
+    Parameters
+    ----------
+    filename : `str` or `pathlib.Path`
+        The name of the file.
+    date_profile : `lsst.ts.dateloc.DateProfile`
+        The date profile giving the location and the MJD calculation. Its
+        internal timestamp is not changed.
+    start : `float`
+        The first UTC timestamp.
+    stop : `float`
+        The end of the range (excluded) as a UTC timestamp.
+    step : `float`
+        The spacing (seconds) of the timestamps.
+    chunk_size : `int`, optional
+        The number of timestamps calculated at a time.
+    utc_offset : `float`, optional
+        The offset (seconds) of the local time from UTC for the nights. The
+        mean solar time offset of the location is used if not given.
+    """
+    filename = os.fspath(filename)
+    if utc_offset is None:
+        utc_offset = date_profile.location.utc_offset
+    size = max(int(math.ceil((stop - start) / step)), 0)
+    chunks = (
+        _timeline_chunk(
+            date_profile,
+            utc_offset,
+            start + np.arange(first, min(first + chunk_size, size)) * step,
+        )
+        for first in range(0, size, chunk_size)
+    )
+    if filename.endswith(".parquet"):
+        _write_parquet(filename, chunks)
+    else:
+        _write_npz(filename, chunks, size)
+
+
+def _write_npz(filename, chunks, size):
+    """Write the timeline columns to an uncompressed ``.npz`` file.
+
+    The members of a zip file are written one after the other, so the
+    columns of each chunk are first appended to temporary files next to the
+    output file, and then copied to the members.
+
+    Parameters
+    ----------
+    filename : `str`
+        The name of the file.
+    chunks : iterable of `Timeline`
+        The columns of the timeline, in chunks.
+    size : `int`
+        The total number of timestamps.
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    with tempfile.TemporaryDirectory(dir=directory) as temporary_directory:
+        paths = [os.path.join(temporary_directory, name) for name in Timeline._fields]
+        with contextlib.ExitStack() as stack:
+            column_files = [stack.enter_context(open(path, "wb")) for path in paths]
+            for columns in chunks:
+                for column_file, values in zip(column_files, columns):
+                    column_file.write(values.tobytes())
+
+        with zipfile.ZipFile(filename, "w", compression=zipfile.ZIP_STORED) as npz_file:
+            for name, dtype, path in zip(Timeline._fields, _COLUMN_DTYPES, paths):
+                with npz_file.open(
+                    f"{name}.npy", "w", force_zip64=True
+                ) as member, open(path, "rb") as column_file:
+                    header = {
+                        "descr": np.lib.format.dtype_to_descr(np.dtype(dtype)),
+                        "fortran_order": False,
+                        "shape": (size,),
+                    }
+                    np.lib.format.write_array_header_1_0(member, header)
+                    shutil.copyfileobj(column_file, member)
+
+
+def _write_parquet(filename, chunks):
+    """Write the timeline columns to a Parquet file.
+
+    Parameters
+    ----------
+    filename : `str`
+        The name of the file.
+    chunks : iterable of `Timeline`
+        The columns of the timeline, in chunks.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema(
+        [
+            (name, pa.from_numpy_dtype(dtype))
+            for (name, dtype) in zip(Timeline._fields, _COLUMN_DTYPES)
+        ]
+    )
+    with pq.ParquetWriter(filename, schema) as writer:
+        for columns in chunks:
+            writer.write_table(pa.table(columns._asdict(), schema=schema))
+
+
+def load_timeline(filename, mmap_mode="r"):
+    """Load a timeline written by `write_timeline`.
+
+    The columns of ``.npz`` files are memory-mapped directly from the file.
+    Parquet files are memory-mapped by pyarrow.
+
+    Parameters
+    ----------
+    filename : `str` or `pathlib.Path`
+        The name of the file.
+    mmap_mode : `str`, optional
+        The memory-map mode of the ``.npz`` columns, see `numpy.memmap`.
+
+    Returns
+    -------
+    `Timeline`
+        The columns of the timeline.
+    """
+    filename = os.fspath(filename)
+    if filename.endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(filename, memory_map=True)
+        return Timeline(*(table.column(name).to_numpy() for name in Timeline._fields))
+
+    with zipfile.ZipFile(filename) as npz_file, open(filename, "rb") as raw_file:
+        columns = []
+        for name in Timeline._fields:
+            info = npz_file.getinfo(f"{name}.npy")
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"Column {name} of {filename} is compressed.")
+            # Skip the local file header, whose name and extra field lengths
+            # can differ from the central directory.
+            raw_file.seek(info.header_offset + _ZIP_LOCAL_HEADER_LENGTHS)
+            name_length, extra_length = struct.unpack("<HH", raw_file.read(4))
+            raw_file.seek(
+                info.header_offset + _ZIP_LOCAL_HEADER_SIZE + name_length + extra_length
+            )
+            if np.lib.format.read_magic(raw_file) == (1, 0):
+                header = np.lib.format.read_array_header_1_0(raw_file)
+            else:
+                header = np.lib.format.read_array_header_2_0(raw_file)
+            shape, fortran_order, dtype = header
+            if 0 in shape:
+                # Empty arrays cannot be memory-mapped.
+                columns.append(np.empty(shape, dtype=dtype))
+                continue
+            columns.append(
+                np.memmap(
+                    filename,
+                    dtype=dtype,
+                    mode=mmap_mode,
+                    offset=raw_file.tell(),
+                    shape=shape,
+                    order="F" if fortran_order else "C",
+                )
+            )
+    return Timeline(*columns)
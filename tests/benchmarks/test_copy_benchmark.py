@@ -0,0 +1,75 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import copy
+import timeit
+import tracemalloc
+import unittest
+
+from lsst.ts.dateloc import DateProfile, ObservatoryLocation
+
+"""Set timestamp as 2022-01-01 0h UTC"""
+LSST_START_TIMESTAMP = 1640995200.0
+"""Number of instances created for the memory measurement"""
+NUM_INSTANCES = 10000
+"""Maximum memory (bytes) for a copy sharing the values of the original"""
+COPY_MEMORY_BUDGET = 160
+"""Maximum memory (bytes) for an instance with its own values"""
+INSTANCE_MEMORY_BUDGET = 400
+
+
+class CopyBenchmarkTest(unittest.TestCase):
+    def setUp(self):
+        self.lsst_site = ObservatoryLocation.from_site("LSST")
+        self.dp = DateProfile(LSST_START_TIMESTAMP, self.lsst_site)
+        self.dp.lst_rad
+
+    def memory_per_instance(self, factory):
+        tracemalloc.start()
+        try:
+            start = tracemalloc.get_traced_memory()[0]
+            instances = [factory(i) for i in range(NUM_INSTANCES)]
+            used = tracemalloc.get_traced_memory()[0] - start
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(len(instances), NUM_INSTANCES)
+        return used / NUM_INSTANCES
+
+    def test_memory_per_instance(self):
+        copy_memory = self.memory_per_instance(lambda i: self.dp.copy())
+        instance_memory = self.memory_per_instance(
+            lambda i: DateProfile(LSST_START_TIMESTAMP + i, self.lsst_site)
+        )
+        self.assertLess(copy_memory, COPY_MEMORY_BUDGET)
+        self.assertLess(instance_memory, INSTANCE_MEMORY_BUDGET)
+
+    def test_copy_throughput(self):
+        number = 10000
+        copy_time = min(timeit.repeat(self.dp.copy, number=number, repeat=3))
+        deepcopy_time = min(
+            timeit.repeat(lambda: copy.deepcopy(self.dp), number=number, repeat=3)
+        )
+        # copy is about two orders of magnitude faster than deepcopy; only a
+        # much smaller margin is required to keep the test stable.
+        self.assertLess(copy_time * 10.0, deepcopy_time)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,252 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+"""Timing benchmarks of the ts_dateloc hot paths.
+
+The timings depend on the machine, so these benchmarks only run when the
+TS_DATELOC_BENCHMARK environment variable is set to 1. Each benchmark
+fails if it is slower than its baseline in baselines.json by more than the
+regression threshold, 1.5 by default or the value of
+TS_DATELOC_BENCHMARK_THRESHOLD. Setting TS_DATELOC_BENCHMARK_SAVE to 1
+records the measured timings as the new baselines instead.
+"""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+import unittest
+
+import numpy as np
+from lsst.ts.dateloc import (
+    DateProfile,
+    NightBoundaries,
+    ObservatoryLocation,
+    SiderealTimeTable,
+    instrumentation,
+)
+
+"""Set timestamp as 2022-01-01 0h UTC"""
+LSST_START_TIMESTAMP = 1640995200.0
+"""A night on a 30 seconds grid"""
+NIGHT_TIMESTAMPS = LSST_START_TIMESTAMP + np.arange(0.0, 12.0 * 3600.0, 30.0)
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baselines.json")
+SAVE_BASELINES = os.environ.get("TS_DATELOC_BENCHMARK_SAVE", "0") == "1"
+RUN_BENCHMARKS = SAVE_BASELINES or os.environ.get("TS_DATELOC_BENCHMARK", "0") == "1"
+REGRESSION_THRESHOLD = float(os.environ.get("TS_DATELOC_BENCHMARK_THRESHOLD", "1.5"))
+
+
+@unittest.skipUnless(
+    RUN_BENCHMARKS, "Set TS_DATELOC_BENCHMARK=1 to run the timing benchmarks."
+)
+class HotPathBenchmark(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.results = {}
+        try:
+            with open(BASELINE_FILE) as baseline_file:
+                cls.baselines = json.load(baseline_file)["timings"]
+        except FileNotFoundError:
+            cls.baselines = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        if SAVE_BASELINES:
+            timings = dict(cls.baselines, **cls.results)
+            with open(BASELINE_FILE, "w") as baseline_file:
+                json.dump(
+                    {
+                        "machine": platform.machine(),
+                        "python": platform.python_version(),
+                        "timings": dict(sorted(timings.items())),
+                    },
+                    baseline_file,
+                    indent=2,
+                )
+                baseline_file.write("\n")
+
+    def setUp(self):
+        self.lsst_site = ObservatoryLocation.from_site("LSST")
+        self.dp = DateProfile(LSST_START_TIMESTAMP, self.lsst_site)
+        self.timestamp = LSST_START_TIMESTAMP
+
+    def check(self, name, function, elapsed=None):
+        """Time a function and compare the result with the baseline.
+
+        Parameters
+        ----------
+        name : `str`
+            The name of the benchmark.
+        function : `callable`
+            The function to time.
+        elapsed : `float`, optional
+            The measured time (seconds), if ``function`` returns its own
+            timing instead of being timed.
+        """
+        if elapsed is None:
+            timer = timeit.Timer(function)
+            number, _ = timer.autorange()
+            elapsed = min(timer.repeat(repeat=5, number=number)) / number
+        self.results[name] = elapsed
+        baseline = self.baselines.get(name)
+        if not SAVE_BASELINES and baseline is not None:
+            self.assertLessEqual(
+                elapsed,
+                baseline * REGRESSION_THRESHOLD,
+                f"{name} took {elapsed:.3g} s, baseline is {baseline:.3g} s.",
+            )
+
+    def next_timestamp(self):
+        self.timestamp += 1.0
+        return self.timestamp
+
+    def test_update(self):
+        self.check("DateProfile.update", lambda: self.dp.update(self.next_timestamp()))
+
+    def test_mjd(self):
+        self.check("DateProfile.mjd", lambda: self.dp.mjd)
+
+    def test_lst_rad(self):
+        self.dp.lst_rad
+        self.check("DateProfile.lst_rad cached", lambda: self.dp.lst_rad)
+
+        def update_lst_rad():
+            self.dp.update(self.next_timestamp())
+            return self.dp.lst_rad
+
+        self.check("DateProfile.update+lst_rad", update_lst_rad)
+
+    def test_instrumentation_disabled(self):
+        instrumentation.enable()
+        instrumentation.disable()
+
+        def update_lst_rad():
+            self.dp.update(self.next_timestamp())
+            return self.dp.lst_rad
+
+        # Same baseline as DateProfile.update+lst_rad without instrumentation.
+        self.check("DateProfile.update+lst_rad", update_lst_rad)
+
+    def test_instrumentation_enabled(self):
+        instrumentation.enable()
+        self.addCleanup(instrumentation.disable)
+
+        def update_lst_rad():
+            self.dp.update(self.next_timestamp())
+            return self.dp.lst_rad
+
+        self.check("DateProfile.update+lst_rad instrumented", update_lst_rad)
+
+    def test_legacy_mjd(self):
+        dp = DateProfile(LSST_START_TIMESTAMP, self.lsst_site, legacy_mjd=True)
+        self.check("DateProfile.update legacy_mjd", lambda: dp.update(1.0e9))
+
+    def test_call(self):
+        self.check("DateProfile.__call__", lambda: self.dp(self.next_timestamp()))
+
+    def test_midnight_helpers(self):
+        def midnights():
+            self.dp.update(self.next_timestamp())
+            self.dp.midnight_timestamp()
+            self.dp.next_midnight_timestamp()
+            self.dp.previous_midnight_timestamp()
+
+        self.check("DateProfile midnights", midnights)
+        self.check("DateProfile.night_index", self.dp.night_index)
+
+    def test_location(self):
+        location = ObservatoryLocation()
+        configuration = ObservatoryLocation.get_configure_dict()
+        self.check("ObservatoryLocation.for_lsst", location.for_lsst)
+        self.check(
+            "ObservatoryLocation.configure", lambda: location.configure(configuration)
+        )
+        self.check(
+            "ObservatoryLocation.from_site",
+            lambda: ObservatoryLocation.from_site("LSST"),
+        )
+
+    def test_compute_many(self):
+        self.check(
+            "DateProfile.compute_many night",
+            lambda: self.dp.compute_many(NIGHT_TIMESTAMPS),
+        )
+
+    def test_compute_fused(self):
+        out = (np.empty(NIGHT_TIMESTAMPS.shape), np.empty(NIGHT_TIMESTAMPS.shape))
+        self.check(
+            "DateProfile.compute_fused night",
+            lambda: self.dp.compute_fused(NIGHT_TIMESTAMPS, out=out),
+        )
+
+    def test_iter_range(self):
+        def consume():
+            for chunk in self.dp.iter_range(
+                LSST_START_TIMESTAMP,
+                LSST_START_TIMESTAMP + 86400.0,
+                1.0,
+                chunk_size=10000,
+            ):
+                pass
+
+        self.check("DateProfile.iter_range day chunks", consume)
+
+    def test_sidereal_table(self):
+        table = SiderealTimeTable(
+            self.lsst_site, LSST_START_TIMESTAMP, LSST_START_TIMESTAMP + 86400.0
+        )
+        self.check(
+            "SiderealTimeTable.lst_rad night", lambda: table.lst_rad(NIGHT_TIMESTAMPS)
+        )
+
+    def test_night_boundaries(self):
+        night_boundaries = NightBoundaries(self.lsst_site)
+        midnights = LSST_START_TIMESTAMP + 86400.0 * np.arange(365)
+        self.check(
+            "NightBoundaries.compute_many year",
+            lambda: night_boundaries.compute_many(midnights),
+        )
+
+    def test_import(self):
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        script = (
+            "import time; start = time.perf_counter(); import lsst.ts.dateloc; "
+            "print(time.perf_counter() - start)"
+        )
+        elapsed = min(
+            float(
+                subprocess.run(
+                    [sys.executable, "-c", script],
+                    env=env,
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout
+            )
+            for _ in range(5)
+        )
+        self.check("import lsst.ts.dateloc", None, elapsed=elapsed)
+
+
+if __name__ == "__main__":
+    unittest.main()
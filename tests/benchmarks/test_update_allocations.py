@@ -0,0 +1,73 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import tracemalloc
+import unittest
+
+from lsst.ts.dateloc import DateProfile, ObservatoryLocation
+
+"""Set timestamp as 2022-01-01 0h UTC"""
+LSST_START_TIMESTAMP = 1640995200.0
+"""Number of updates of the allocation measurement"""
+NUM_UPDATES = 10000
+
+
+class UpdateAllocationTest(unittest.TestCase):
+    def setUp(self):
+        self.lsst_site = ObservatoryLocation.from_site("LSST")
+        self.dp = DateProfile(LSST_START_TIMESTAMP, self.lsst_site)
+        self.timestamps = [LSST_START_TIMESTAMP + 0.1 * i for i in range(NUM_UPDATES)]
+
+    def net_allocation(self, function):
+        def run():
+            for timestamp in self.timestamps:
+                function(timestamp)
+
+        tracemalloc.start()
+        try:
+            # The values stored by the first pass are still alive after it,
+            # so only the growth during the second pass is measured.
+            run()
+            start = tracemalloc.get_traced_memory()[0]
+            run()
+            used = tracemalloc.get_traced_memory()[0] - start
+        finally:
+            tracemalloc.stop()
+        return used
+
+    def test_update(self):
+        self.assertEqual(self.net_allocation(self.dp.update), 0)
+
+    def test_update_legacy_mjd(self):
+        self.dp.legacy_mjd = True
+        self.assertEqual(self.net_allocation(self.dp.update), 0)
+
+    def test_update_lst_and_midnight(self):
+        def update(timestamp):
+            self.dp.update(timestamp)
+            self.dp.lst_rad
+            self.dp.midnight_timestamp()
+            self.dp.next_midnight_timestamp()
+
+        self.assertEqual(self.net_allocation(update), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
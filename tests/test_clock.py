@@ -0,0 +1,89 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import asyncio
+import unittest
+
+from lsst.ts.dateloc import AsyncDateClock, DateProfile, ObservatoryLocation
+
+"""Set timestamp as 2022-01-01 0h UTC"""
+LSST_START_TIMESTAMP = 1640995200.0
+
+
+class FakeTime(object):
+    """Clock advancing one second per call."""
+
+    def __init__(self):
+        self.timestamp = LSST_START_TIMESTAMP
+
+    def __call__(self):
+        self.timestamp += 1.0
+        return self.timestamp
+
+
+class AsyncDateClockTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.lsst_site = ObservatoryLocation.from_site("LSST")
+        self.time_func = FakeTime()
+        self.clock = AsyncDateClock(
+            self.lsst_site, interval=0.01, time_func=self.time_func
+        )
+
+    async def test_tick(self):
+        self.assertEqual(self.clock.latest.timestamp, LSST_START_TIMESTAMP + 1.0)
+        snapshot = self.clock.tick()
+        self.assertIs(self.clock.latest, snapshot)
+        dp = DateProfile(LSST_START_TIMESTAMP + 2.0, self.lsst_site)
+        self.assertEqual(snapshot, dp.snapshot())
+
+    async def test_subscribe(self):
+        queue = self.clock.subscribe()
+        other = self.clock.subscribe(maxsize=10)
+        for _ in range(3):
+            self.clock.tick()
+        # Full queues keep the most recent values.
+        self.assertEqual(queue.qsize(), 1)
+        self.assertEqual(queue.get_nowait(), self.clock.latest)
+        self.assertEqual(other.qsize(), 3)
+        self.clock.unsubscribe(queue)
+        self.clock.tick()
+        self.assertTrue(queue.empty())
+        self.assertEqual(other.qsize(), 4)
+
+    async def test_run(self):
+        queue = self.clock.subscribe(maxsize=100)
+        async with self.clock:
+            self.assertTrue(self.clock.running)
+            first = await asyncio.wait_for(queue.get(), timeout=1.0)
+            second = await asyncio.wait_for(queue.get(), timeout=1.0)
+        self.assertFalse(self.clock.running)
+        self.assertGreater(second.timestamp, first.timestamp)
+        self.assertGreater(second.lst_rad, first.lst_rad)
+        latest = self.clock.latest
+        await asyncio.sleep(0.05)
+        self.assertIs(self.clock.latest, latest)
+
+    async def test_stop_without_start(self):
+        await self.clock.stop()
+        self.assertFalse(self.clock.running)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import math
+import unittest
+
+import numpy as np
+import palpy
+from lsst.ts.dateloc import DateProfile, ObservatoryLocation, radec_to_altaz
+
+"""Set timestamp as 2022-01-01 0h UTC"""
+LSST_START_TIMESTAMP = 1640995200.0
+
+
+def angle_difference(angle1, angle2):
+    return (angle1 - angle2 + math.pi) % (2.0 * math.pi) - math.pi
+
+
+class CoordinatesTest(unittest.TestCase):
+    def setUp(self):
+        self.lsst_site = ObservatoryLocation.from_site("LSST")
+        self.dp = DateProfile(LSST_START_TIMESTAMP, self.lsst_site)
+        rng = np.random.default_rng(8)
+        self.ra_rad = rng.uniform(0.0, 2.0 * math.pi, 1000)
+        self.dec_rad = np.arcsin(rng.uniform(-1.0, 1.0, 1000))
+
+    def test_against_palpy(self):
+        coordinates = self.dp.radec_to_altaz(self.ra_rad, self.dec_rad)
+        hour_angle = self.dp.lst_rad - self.ra_rad
+        azimuth, altitude = palpy.de2hVector(
+            hour_angle, self.dec_rad, self.lsst_site.latitude_rad
+        )
+        parallactic_angle = palpy.paVector(
+            hour_angle, self.dec_rad, self.lsst_site.latitude_rad
+        )
+        np.testing.assert_allclose(
+            angle_difference(coordinates.hour_angle, hour_angle), 0.0, atol=1e-12
+        )
+        self.assertTrue(np.all(np.abs(coordinates.hour_angle) <= math.pi))
+        np.testing.assert_allclose(coordinates.altitude, altitude, atol=1e-12)
+        np.testing.assert_allclose(
+            angle_difference(coordinates.azimuth, azimuth), 0.0, atol=1e-12
+        )
+        self.assertTrue(np.all(coordinates.azimuth >= 0.0))
+        np.testing.assert_allclose(
+            angle_difference(coordinates.parallactic_angle, parallactic_angle),
+            0.0,
+            atol=1e-12,
+        )
+
+    def test_fields_by_times(self):
+        timestamps = LSST_START_TIMESTAMP + np.arange(0.0, 3600.0, 600.0)
+        coordinates = self.dp.radec_to_altaz(
+            self.ra_rad, self.dec_rad, timestamps[:, np.newaxis]
+        )
+        self.assertEqual(coordinates.altitude.shape, (timestamps.size, 1000))
+        for i, timestamp in enumerate(timestamps):
+            self.dp.update(timestamp)
+            expected = radec_to_altaz(
+                self.ra_rad, self.dec_rad, self.dp.lst_rad, self.lsst_site
+            )
+            np.testing.assert_allclose(
+                coordinates.altitude[i], expected.altitude, atol=1e-9
+            )
+            np.testing.assert_allclose(
+                coordinates.azimuth[i], expected.azimuth, atol=1e-9
+            )
+
+    def test_zenith(self):
+        coordinates = self.dp.radec_to_altaz(
+            self.dp.lst_rad, self.lsst_site.latitude_rad
+        )
+        self.assertAlmostEqual(coordinates.altitude, math.pi / 2.0)
+        self.assertAlmostEqual(coordinates.hour_angle, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,8 +20,13 @@
 
 from __future__ import division
 
+import pickle
 import unittest
+from datetime import datetime
+from unittest import mock
 
+import numpy as np
+import palpy
 from lsst.ts.dateloc import DateProfile, ObservatoryLocation
 
 """Set timestamp as 2022-01-01 0h UTC"""
@@ -83,6 +88,193 @@ class DateProfileTest(unittest.TestCase):
             LSST_START_TIMESTAMP - (24.0 * 60.0 * 60.0),
         )
 
+    def test_compute_many(self):
+        timestamps = LSST_START_TIMESTAMP + np.arange(0.0, 86400.0, 30.0)
+        timestamps[1::7] += 0.25
+        (mjd, lst_rad) = self.dp.compute_many(timestamps)
+        self.assertEqual(mjd.shape, timestamps.shape)
+        self.assertEqual(lst_rad.shape, timestamps.shape)
+        for timestamp, mjd_value, lst_value in zip(timestamps, mjd, lst_rad):
+            (mjd_truth, lst_truth) = self.dp(timestamp)
+            self.assertAlmostEqual(mjd_value, mjd_truth, delta=1e-9)
+            self.assertAlmostEqual(lst_value, lst_truth, delta=1e-9)
+
+    def test_compute_many_keeps_timestamp(self):
+        self.dp.compute_many([LSST_START_TIMESTAMP + 3600.0])
+        self.assertEqual(self.dp.timestamp, LSST_START_TIMESTAMP)
+
+    def test_compute_many_scalar(self):
+        (mjd, lst_rad) = self.dp.compute_many(LSST_START_TIMESTAMP + 3600.0)
+        self.assertEqual(mjd.shape, ())
+        self.assertEqual(mjd, LSST_START_MJD + (1.0 / 24.0))
+        self.assertAlmostEqual(lst_rad, 0.7840316524739084, delta=1e-6)
+
+    def test_sub_second_mjd(self):
+        self.dp.update(LSST_START_TIMESTAMP + 1.5)
+        self.assertAlmostEqual(
+            self.dp.mjd, LSST_START_MJD + (1.5 / 86400.0), delta=1e-10
+        )
+
+    def test_legacy_mjd(self):
+        dp = DateProfile(LSST_START_TIMESTAMP + 1.5, self.lsst_site, legacy_mjd=True)
+        self.assertEqual(dp.mjd, LSST_START_MJD + (1.0 / 86400.0))
+        timestamps = LSST_START_TIMESTAMP + np.arange(0.0, 86400.0, 30.0)
+        timestamps[1::7] += 0.75
+        (mjd, lst_rad) = dp.compute_many(timestamps)
+        for timestamp, mjd_value, lst_value in zip(timestamps, mjd, lst_rad):
+            self.assertEqual((mjd_value, lst_value), dp(timestamp))
+
+    def test_legacy_mjd_change(self):
+        self.dp.update(LSST_START_TIMESTAMP + 0.75)
+        lst_rad = self.dp.lst_rad
+        self.dp.legacy_mjd = True
+        self.assertEqual(self.dp.mjd, LSST_START_MJD)
+        self.assertNotEqual(self.dp.lst_rad, lst_rad)
+        self.assertEqual(
+            (self.dp.mjd, self.dp.lst_rad), self.dp(LSST_START_TIMESTAMP + 0.75)
+        )
+        self.dp.legacy_mjd = False
+        self.assertEqual(self.dp.mjd, LSST_START_MJD + 0.75 / 86400.0)
+        self.assertEqual(self.dp.lst_rad, lst_rad)
+
+    def test_derived_values_are_cached(self):
+        self.dp.update(LSST_START_TIMESTAMP + 3600.0)
+        with mock.patch.object(palpy, "gmst", wraps=palpy.gmst) as gmst:
+            lst_rad = self.dp.lst_rad
+            self.dp(LSST_START_TIMESTAMP + 3600.0)
+            for _ in range(10):
+                self.assertEqual(self.dp.lst_rad, lst_rad)
+                self.assertEqual(self.dp.midnight_timestamp(), LSST_START_TIMESTAMP)
+            self.assertEqual(gmst.call_count, 2)
+
+    def test_lst_follows_location_changes(self):
+        lst_rad = self.dp.lst_rad
+        self.lsst_site.reconfigure(
+            self.lsst_site.latitude_rad,
+            self.lsst_site.longitude_rad + 0.5,
+            self.lsst_site.height,
+        )
+        self.assertAlmostEqual(self.dp.lst_rad, lst_rad + 0.5, delta=1e-12)
+        self.dp.location = ObservatoryLocation()
+        self.assertEqual(self.dp.gmst_rad, palpy.gmst(LSST_START_MJD))
+        self.assertEqual(self.dp.lst_rad, self.dp.gmst_rad)
+
+    def test_current_dt_is_lazy(self):
+        self.dp.update(LSST_START_TIMESTAMP + 3723.4567891)
+        self.assertEqual(self.dp.day, 18993)
+        self.assertAlmostEqual(self.dp.seconds_of_day, 3723.4567891, places=6)
+        self.assertIsNone(self.dp._current_dt)
+        self.assertEqual(self.dp.current_dt, datetime(2022, 1, 1, 1, 2, 3, 456789))
+        self.assertIs(self.dp.current_dt, self.dp._current_dt)
+        self.dp.update(LSST_START_TIMESTAMP - 0.5)
+        self.assertEqual(self.dp.day, 18992)
+        self.assertEqual(self.dp.seconds_of_day, 86399.5)
+        self.assertEqual(self.dp.current_dt, datetime(2021, 12, 31, 23, 59, 59, 500000))
+
+    def test_slots(self):
+        self.assertFalse(hasattr(self.dp, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.dp.not_an_attribute = 1.0
+
+    def test_pickle(self):
+        self.dp.update(LSST_START_TIMESTAMP + 3600.0)
+        dp = pickle.loads(pickle.dumps(self.dp))
+        self.assertEqual(dp.timestamp, self.dp.timestamp)
+        self.assertEqual(dp.mjd, self.dp.mjd)
+        self.assertEqual(dp.lst_rad, self.dp.lst_rad)
+        self.assertEqual(dp.location.longitude_rad, self.lsst_site.longitude_rad)
+
+    def test_copy(self):
+        lst_rad = self.dp.lst_rad
+        dp = self.dp.copy()
+        self.assertIs(dp.location, self.dp.location)
+        self.assertEqual(dp.lst_rad, lst_rad)
+        dp.update(LSST_START_TIMESTAMP + 3600.0)
+        self.assertEqual(self.dp.timestamp, LSST_START_TIMESTAMP)
+        self.assertEqual(self.dp.lst_rad, lst_rad)
+        self.assertEqual(dp.mjd, LSST_START_MJD + (1.0 / 24.0))
+
+    def test_snapshot(self):
+        snapshot = self.dp.snapshot()
+        self.assertEqual(snapshot.timestamp, LSST_START_TIMESTAMP)
+        self.assertEqual(snapshot.mjd, LSST_START_MJD)
+        self.assertEqual(snapshot.lst_rad, self.dp.lst_rad)
+        self.assertEqual(snapshot.midnight, self.dp.midnight_timestamp())
+        self.assertEqual(snapshot.local_midnight, self.dp.local_midnight_timestamp())
+        self.dp.update(LSST_START_TIMESTAMP + 3600.0)
+        self.assertEqual(snapshot.timestamp, LSST_START_TIMESTAMP)
+        with self.assertRaises(AttributeError):
+            snapshot.mjd = 0.0
+
+    def test_iter_range(self):
+        stop = LSST_START_TIMESTAMP + 2.0 * 86400.0
+        values = list(self.dp.iter_range(LSST_START_TIMESTAMP, stop, 30.0))
+        self.assertEqual(len(values), 2 * 2880)
+        timestamps = np.array([value[0] for value in values])
+        np.testing.assert_array_equal(
+            timestamps, LSST_START_TIMESTAMP + 30.0 * np.arange(len(values))
+        )
+        (mjd, lst_rad) = self.dp.compute_many(timestamps)
+        np.testing.assert_allclose([value[1] for value in values], mjd, atol=1e-9)
+        np.testing.assert_allclose([value[2] for value in values], lst_rad, atol=1e-9)
+        self.assertEqual(self.dp.timestamp, LSST_START_TIMESTAMP)
+
+    def test_iter_range_chunks(self):
+        stop = LSST_START_TIMESTAMP + 3.5 * 86400.0
+        values = list(self.dp.iter_range(LSST_START_TIMESTAMP, stop, 7.0))
+        chunks = list(
+            self.dp.iter_range(
+                LSST_START_TIMESTAMP, stop, 7.0, chunk_size=5000, resync_interval=3600.0
+            )
+        )
+        self.assertTrue(all(chunk[0].size <= 5000 for chunk in chunks))
+        for i in range(3):
+            np.testing.assert_allclose(
+                np.concatenate([chunk[i] for chunk in chunks]),
+                [value[i] for value in values],
+                rtol=0.0,
+                atol=1e-9,
+            )
+
+    def test_iter_range_empty(self):
+        self.assertEqual(
+            list(self.dp.iter_range(LSST_START_TIMESTAMP, LSST_START_TIMESTAMP, 1.0)),
+            [],
+        )
+
+    def test_mjd_to_timestamp(self):
+        self.assertEqual(
+            DateProfile.mjd_to_timestamp(LSST_START_MJD), LSST_START_TIMESTAMP
+        )
+        timestamps = LSST_START_TIMESTAMP + np.linspace(-3e8, 3e8, 1001) + 0.123
+        (mjd, _) = self.dp.compute_many(timestamps)
+        np.testing.assert_allclose(
+            DateProfile.mjd_to_timestamp(mjd), timestamps, rtol=0.0, atol=1e-5
+        )
+
+    def test_next_lst_timestamp(self):
+        rng = np.random.default_rng(16)
+        after = LSST_START_TIMESTAMP + rng.uniform(-3e8, 3e8, 1000)
+        lst_rad = rng.uniform(0.0, 2.0 * np.pi, 1000)
+        timestamps = self.dp.next_lst_timestamp(lst_rad, after)
+        (_, found_lst_rad) = self.dp.compute_many(timestamps)
+        error = np.mod(found_lst_rad - lst_rad + np.pi, 2.0 * np.pi) - np.pi
+        # 1e-9 radians is about 14 microseconds.
+        np.testing.assert_allclose(error, 0.0, atol=1e-9)
+        self.assertTrue(np.all(timestamps >= after))
+        self.assertTrue(np.all(timestamps - after < 86164.1))
+
+    def test_next_lst_timestamp_scalar(self):
+        self.dp.update(LSST_START_TIMESTAMP)
+        timestamp = self.dp.next_lst_timestamp(self.dp.lst_rad)
+        self.assertIsInstance(timestamp, float)
+        self.assertAlmostEqual(timestamp, LSST_START_TIMESTAMP, delta=1e-4)
+        # Broadcast one LST against the starts of three nights.
+        starts = LSST_START_TIMESTAMP + np.array([0.0, 1.0, 2.0]) * 86400.0
+        timestamps = self.dp.next_lst_timestamp(1.0, starts)
+        self.assertEqual(timestamps.shape, (3,))
+        np.testing.assert_allclose(np.diff(timestamps), 86164.09, atol=0.01)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,148 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import math
+import unittest
+from unittest import mock
+
+import numpy as np
+import palpy
+from lsst.ts.dateloc import (
+    BodyEphemeris,
+    DateProfile,
+    Dut1Table,
+    ObservatoryLocation,
+    moon_ra_dec,
+    utc_to_tt,
+)
+
+"""Set timestamp as 2022-01-01 0h UTC"""
+LSST_START_TIMESTAMP = 1640995200.0
+"""Full Moon of 2022-01-17 23:48 UTC"""
+FULL_MOON_TIMESTAMP = 1642463280.0
+"""New Moon of 2022-01-02 18:33 UTC"""
+NEW_MOON_TIMESTAMP = 1641148380.0
+
+
+class BodyEphemerisTest(unittest.TestCase):
+    def setUp(self):
+        self.lsst_site = ObservatoryLocation.from_site("LSST")
+        self.dp = DateProfile(LSST_START_TIMESTAMP, self.lsst_site)
+        self.ephemeris = BodyEphemeris(self.dp)
+
+    def tt_mjd(self, timestamp):
+        return DateProfile.MJD_UNIX_EPOCH + utc_to_tt(timestamp) / 86400.0
+
+    def test_moon_position(self):
+        timestamps = LSST_START_TIMESTAMP + np.linspace(0.0, 3.0e7, 30)
+        geocentric_ra, geocentric_dec, distance = moon_ra_dec(self.tt_mjd(timestamps))
+        _, lst_rad = self.dp.compute_many(timestamps)
+        ra, dec, _ = moon_ra_dec(self.tt_mjd(timestamps), lst_rad, self.lsst_site)
+        for i, timestamp in enumerate(timestamps):
+            mjd = self.tt_mjd(timestamp)
+            position = palpy.dmoon(mjd)[:3]
+            x, y, z = position
+            self.assertAlmostEqual(distance[i], math.sqrt(x * x + y * y + z * z))
+            ra_truth, dec_truth = palpy.dcc2s(position)
+            self.assertAlmostEqual(
+                palpy.dsep(geocentric_ra[i], geocentric_dec[i], ra_truth, dec_truth),
+                0.0,
+                delta=1e-12,
+            )
+            # rdplan gives apparent places, which differ by the nutation.
+            ra_truth, dec_truth, _ = palpy.rdplan(
+                mjd, 3, self.lsst_site.longitude_rad, self.lsst_site.latitude_rad
+            )
+            self.assertAlmostEqual(
+                palpy.dsep(ra[i], dec[i], ra_truth, dec_truth),
+                0.0,
+                delta=math.radians(30.0 / 3600.0),
+            )
+
+    def test_positions(self):
+        self.dp.update(LSST_START_TIMESTAMP + 3600.0)
+        positions = self.ephemeris.positions
+        self.assertIsInstance(positions.moon_alt, float)
+        _, altitude = palpy.de2h(
+            self.dp.lst_rad - positions.sun_ra,
+            positions.sun_dec,
+            self.lsst_site.latitude_rad,
+        )
+        self.assertAlmostEqual(positions.sun_alt, altitude, delta=1e-12)
+        _, altitude = palpy.de2h(
+            self.dp.lst_rad - positions.moon_ra,
+            positions.moon_dec,
+            self.lsst_site.latitude_rad,
+        )
+        self.assertAlmostEqual(positions.moon_alt, altitude, delta=1e-12)
+
+    def test_moon_phase(self):
+        self.dp.update(FULL_MOON_TIMESTAMP)
+        self.assertGreater(self.ephemeris.positions.moon_phase, 0.998)
+        self.assertGreater(self.ephemeris.positions.moon_elongation, 3.0)
+        self.dp.update(NEW_MOON_TIMESTAMP)
+        self.assertLess(self.ephemeris.positions.moon_phase, 0.002)
+        self.assertLess(self.ephemeris.positions.moon_elongation, 0.2)
+
+    def test_positions_are_cached(self):
+        with mock.patch.object(
+            palpy, "dmoonVector", wraps=palpy.dmoonVector
+        ) as dmoon_vector:
+            positions = self.ephemeris.positions
+            self.dp.update(LSST_START_TIMESTAMP)
+            for _ in range(10):
+                self.assertIs(self.ephemeris.positions, positions)
+            self.assertEqual(dmoon_vector.call_count, 1)
+            self.dp.update(LSST_START_TIMESTAMP + 60.0)
+            self.assertIsNot(self.ephemeris.positions, positions)
+            self.assertEqual(dmoon_vector.call_count, 2)
+            self.lsst_site.reconfigure(
+                self.lsst_site.latitude_rad, self.lsst_site.longitude_rad, 0.0
+            )
+            self.ephemeris.positions
+            self.assertEqual(dmoon_vector.call_count, 3)
+
+    def test_positions_follow_time_scales(self):
+        self.dp.update(LSST_START_TIMESTAMP + 0.75)
+        positions = self.ephemeris.positions
+        self.dp.legacy_mjd = True
+        legacy_positions = self.ephemeris.positions
+        self.assertNotEqual(legacy_positions, positions)
+        self.assertEqual(legacy_positions, BodyEphemeris(self.dp).positions)
+        self.dp.legacy_mjd = False
+        self.dp.dut1_table = Dut1Table([59580.0, 59590.0], [-0.3, -0.3])
+        ut1_positions = self.ephemeris.positions
+        self.assertNotEqual(ut1_positions, positions)
+        self.assertEqual(ut1_positions, BodyEphemeris(self.dp).positions)
+
+    def test_compute_many(self):
+        timestamps = LSST_START_TIMESTAMP + np.arange(0.0, 43200.0, 900.0)
+        positions = self.ephemeris.compute_many(timestamps.reshape(4, -1))
+        self.assertEqual(self.dp.timestamp, LSST_START_TIMESTAMP)
+        for values in positions:
+            self.assertEqual(values.shape, (4, timestamps.size // 4))
+        for i, timestamp in enumerate(timestamps):
+            self.dp.update(timestamp)
+            for values, truth in zip(positions, self.ephemeris.positions):
+                self.assertAlmostEqual(values.flat[i], truth, delta=1e-12)
+
+
+if __name__ == "__main__":
+    unittest.main()
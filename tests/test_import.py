@@ -0,0 +1,65 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+"""Maximum time (seconds) allowed for importing lsst.ts.dateloc"""
+IMPORT_TIME_BUDGET = 1.0
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import lsst.ts.dateloc
+location = lsst.ts.dateloc.ObservatoryLocation()
+location.for_lsst()
+lsst.ts.dateloc.DateProfile(0.0, location).lst_rad
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+class ImportTest(unittest.TestCase):
+    def run_import(self):
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        return json.loads(output)
+
+    def test_import_time(self):
+        # Take the best of a few runs to reduce the noise from a busy machine.
+        elapsed = min(self.run_import()["elapsed"] for _ in range(3))
+        self.assertLess(elapsed, IMPORT_TIME_BUDGET)
+
+    def test_rubin_scheduler_not_imported(self):
+        modules = self.run_import()["modules"]
+        self.assertNotIn("rubin_scheduler", modules)
+
+
+if __name__ == "__main__":
+    unittest.main()
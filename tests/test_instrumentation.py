@@ -0,0 +1,124 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import unittest
+
+from lsst.ts.dateloc import (
+    BodyEphemeris,
+    DateProfile,
+    NightBoundaries,
+    ObservatoryLocation,
+    instrumentation,
+)
+
+"""Set timestamp as 2022-01-01 0h UTC"""
+LSST_START_TIMESTAMP = 1640995200.0
+
+
+class InstrumentationTest(unittest.TestCase):
+    def setUp(self):
+        self.lsst_site = ObservatoryLocation.from_site("LSST")
+        self.dp = DateProfile(LSST_START_TIMESTAMP, self.lsst_site)
+        instrumentation.reset()
+        instrumentation.enable()
+        self.addCleanup(instrumentation.disable)
+
+    def test_calls(self):
+        for i in range(3):
+            self.dp.update(LSST_START_TIMESTAMP + i)
+            self.dp.mjd
+        self.dp(LSST_START_TIMESTAMP)
+        counters = instrumentation.snapshot()
+        self.assertTrue(counters["enabled"])
+        self.assertEqual(counters["calls"]["DateProfile.update"], 4)
+        self.assertEqual(counters["calls"]["DateProfile.__call__"], 1)
+        self.assertEqual(counters["calls"]["DateProfile.mjd"], 4)
+        self.assertGreater(counters["time"]["DateProfile.update"], 0.0)
+
+    def test_cache_hits(self):
+        self.dp.update(LSST_START_TIMESTAMP)
+        self.dp.lst_rad
+        self.dp.lst_rad
+        self.dp.current_dt
+        self.dp.current_dt
+        self.lsst_site.for_lsst()
+        self.dp.lst_rad
+        counters = instrumentation.snapshot()
+        self.assertEqual(counters["calls"]["DateProfile.lst_rad"], 3)
+        self.assertEqual(counters["cache_misses"]["DateProfile.lst_rad"], 2)
+        self.assertEqual(counters["cache_hits"]["DateProfile.lst_rad"], 1)
+        self.assertEqual(counters["cache_misses"]["DateProfile.gmst_rad"], 1)
+        self.assertEqual(counters["cache_hits"]["DateProfile.gmst_rad"], 1)
+        self.assertEqual(counters["cache_misses"]["DateProfile.current_dt"], 1)
+        self.assertEqual(counters["cache_hits"]["DateProfile.current_dt"], 1)
+        self.assertEqual(counters["calls"]["ObservatoryLocation.for_lsst"], 1)
+        self.assertEqual(counters["cache_hits"]["ObservatoryLocation.site"], 1)
+
+    def test_night_boundaries_cache(self):
+        night_boundaries = NightBoundaries(self.lsst_site)
+        night_boundaries(LSST_START_TIMESTAMP)
+        night_boundaries(LSST_START_TIMESTAMP)
+        counters = instrumentation.snapshot()
+        self.assertEqual(counters["cache_misses"]["NightBoundaries.__call__"], 1)
+        self.assertEqual(counters["cache_hits"]["NightBoundaries.__call__"], 1)
+
+    def test_body_ephemeris_cache(self):
+        ephemeris = BodyEphemeris(self.dp)
+        ephemeris.positions
+        ephemeris.positions
+        self.dp.update(LSST_START_TIMESTAMP + 1.0)
+        ephemeris.positions
+        counters = instrumentation.snapshot()
+        self.assertEqual(counters["cache_misses"]["BodyEphemeris.positions"], 2)
+        self.assertEqual(counters["cache_hits"]["BodyEphemeris.positions"], 1)
+
+    def test_location_reconfiguration(self):
+        location = ObservatoryLocation()
+        location.configure(ObservatoryLocation.get_configure_dict())
+        location.reconfigure(0.1, 0.2, 10.0)
+        counters = instrumentation.snapshot()
+        self.assertEqual(counters["calls"]["ObservatoryLocation.configure"], 1)
+        self.assertEqual(counters["calls"]["ObservatoryLocation.reconfigure"], 1)
+        self.assertEqual(location.latitude_rad, 0.1)
+
+    def test_disable(self):
+        self.dp.update(LSST_START_TIMESTAMP)
+        instrumentation.enable()
+        instrumentation.disable()
+        self.assertFalse(instrumentation.is_enabled())
+        # The original functions are restored, so there is no overhead.
+        self.assertNotIn("__wrapped__", vars(vars(DateProfile)["update"]))
+        self.assertNotIn("__wrapped__", vars(vars(DateProfile)["lst_rad"].fget))
+        self.dp.update(LSST_START_TIMESTAMP)
+        self.dp.lst_rad
+        counters = instrumentation.snapshot()
+        self.assertEqual(counters["calls"]["DateProfile.update"], 1)
+        self.assertEqual(counters["calls"]["DateProfile.lst_rad"], 0)
+        instrumentation.reset()
+        self.assertEqual(instrumentation.snapshot()["calls"]["DateProfile.update"], 0)
+
+    def test_values(self):
+        mjd, lst_rad = self.dp(LSST_START_TIMESTAMP)
+        instrumentation.disable()
+        self.assertEqual(self.dp(LSST_START_TIMESTAMP), (mjd, lst_rad))
+
+
+if __name__ == "__main__":
+    unittest.main()
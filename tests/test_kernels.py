@@ -0,0 +1,137 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import importlib.util
+import unittest
+
+import numpy as np
+import palpy
+from lsst.ts.dateloc import (
+    DateProfile,
+    Dut1Table,
+    ObservatoryLocation,
+    gmst_kernel,
+    kernel_backend,
+    kernels,
+    mjd_lst_kernel,
+)
+
+"""Set timestamp as 2022-01-01 0h UTC"""
+LSST_START_TIMESTAMP = 1640995200.0
+"""Tolerance (radians) of the sidereal times"""
+TOLERANCE = 1e-12
+
+HAVE_NUMBA = importlib.util.find_spec("numba") is not None
+
+
+class KernelsTest(unittest.TestCase):
+    def setUp(self):
+        self.lsst_site = ObservatoryLocation.from_site("LSST")
+        self.dp = DateProfile(LSST_START_TIMESTAMP, self.lsst_site)
+        rng = np.random.default_rng(25)
+        # Timestamps from 1940 to 2065, some on whole seconds, spanning
+        # several blocks of the NumPy kernels.
+        self.timestamps = rng.uniform(-9.5e8, 3.0e9, 3 * kernels._BLOCK_SIZE + 17)
+        self.timestamps[::5] = np.round(self.timestamps[::5])
+        self.mjd = rng.uniform(30000.0, 100000.0, self.timestamps.size)
+
+    def test_backend(self):
+        self.assertEqual(kernel_backend(), "numba" if HAVE_NUMBA else "numpy")
+
+    def test_gmst(self):
+        gmst_rad = gmst_kernel(self.mjd)
+        np.testing.assert_allclose(
+            gmst_rad, palpy.gmstVector(self.mjd), rtol=0.0, atol=TOLERANCE
+        )
+        self.assertAlmostEqual(
+            float(gmst_kernel(59580.25)), palpy.gmst(59580.25), delta=TOLERANCE
+        )
+
+    def test_mjd_lst(self):
+        mjd, lst_rad = mjd_lst_kernel(self.timestamps, self.lsst_site.longitude_rad)
+        mjd_truth, lst_truth = self.dp.compute_many(self.timestamps)
+        np.testing.assert_array_equal(mjd, mjd_truth)
+        np.testing.assert_allclose(lst_rad, lst_truth, rtol=0.0, atol=TOLERANCE)
+
+    def test_python_loops(self):
+        # The loops compiled by numba, run as plain Python.
+        gmst_loop, mjd_lst_loop = kernels._make_loops(lambda function: function)
+        size = 1000
+        gmst_rad = np.empty(size)
+        gmst_loop(self.mjd[:size], gmst_rad)
+        np.testing.assert_allclose(
+            gmst_rad, palpy.gmstVector(self.mjd[:size]), rtol=0.0, atol=TOLERANCE
+        )
+        mjd = np.empty(size)
+        lst_rad = np.empty(size)
+        mjd_lst_loop(self.timestamps[:size], self.lsst_site.longitude_rad, mjd, lst_rad)
+        mjd_truth, lst_truth = self.dp.compute_many(self.timestamps[:size])
+        np.testing.assert_array_equal(mjd, mjd_truth)
+        np.testing.assert_allclose(lst_rad, lst_truth, rtol=0.0, atol=TOLERANCE)
+
+    def test_output_arrays(self):
+        timestamps = self.timestamps[:600].reshape(20, 30)
+        out = (np.empty((20, 30)), np.empty((20, 30)))
+        result = mjd_lst_kernel(timestamps, self.lsst_site.longitude_rad, out=out)
+        self.assertIs(result[0], out[0])
+        self.assertIs(result[1], out[1])
+        mjd_truth, lst_truth = self.dp.compute_many(timestamps)
+        np.testing.assert_array_equal(out[0], mjd_truth)
+        np.testing.assert_allclose(out[1], lst_truth, rtol=0.0, atol=TOLERANCE)
+
+        gmst_rad = np.empty(10)
+        self.assertIs(gmst_kernel(self.mjd[:10], out=gmst_rad), gmst_rad)
+        for bad_out in (
+            np.empty(11),
+            np.empty(10, dtype=np.float32),
+            np.empty(20)[::2],
+        ):
+            with self.assertRaises(ValueError):
+                gmst_kernel(self.mjd[:10], out=bad_out)
+        with self.assertRaises(ValueError):
+            mjd_lst_kernel(timestamps, 0.0, out=(out[0], np.empty(600)))
+
+    def test_date_profile(self):
+        out = (np.empty(self.timestamps.size), np.empty(self.timestamps.size))
+        mjd, lst_rad = self.dp.compute_fused(self.timestamps, out=out)
+        self.assertIs(mjd, out[0])
+        self.assertEqual(self.dp.timestamp, LSST_START_TIMESTAMP)
+        mjd_truth, lst_truth = self.dp.compute_many(self.timestamps)
+        np.testing.assert_array_equal(mjd, mjd_truth)
+        np.testing.assert_allclose(lst_rad, lst_truth, rtol=0.0, atol=TOLERANCE)
+
+    def test_date_profile_fallback(self):
+        dut1_table = Dut1Table([59580.0, 59590.0], [-0.1, -0.11])
+        for dp in (
+            DateProfile(LSST_START_TIMESTAMP, self.lsst_site, legacy_mjd=True),
+            DateProfile(LSST_START_TIMESTAMP, self.lsst_site, dut1_table=dut1_table),
+        ):
+            out = (np.empty(100), np.empty(100))
+            mjd, lst_rad = dp.compute_fused(self.timestamps[:100], out=out)
+            self.assertIs(lst_rad, out[1])
+            mjd_truth, lst_truth = dp.compute_many(self.timestamps[:100])
+            np.testing.assert_array_equal(mjd, mjd_truth)
+            np.testing.assert_array_equal(lst_rad, lst_truth)
+            mjd, lst_rad = dp.compute_fused(self.timestamps[:100])
+            np.testing.assert_array_equal(lst_rad, lst_truth)
+
+
+if __name__ == "__main__":
+    unittest.main()
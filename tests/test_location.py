@@ -21,10 +21,13 @@
 from __future__ import division
 
 import math
+import pickle
 import unittest
+from unittest import mock
 
 import rubin_scheduler.utils as rs_utils
 from lsst.ts.dateloc import ObservatoryLocation
+from lsst.ts.dateloc import location as location_module
 
 
 class ObservatoryLocationTest(unittest.TestCase):
@@ -80,6 +83,108 @@ class ObservatoryLocationTest(unittest.TestCase):
         self.assertEqual(len(cd), 1)
         self.assertEqual(len(cd["obs_site"]), 3)
 
+    def test_version_changes(self):
+        location = ObservatoryLocation()
+        versions = [location.version]
+        location.for_lsst()
+        versions.append(location.version)
+        location.reconfigure(
+            self.latitude_rad_truth, self.longitude_rad_truth, self.height_truth
+        )
+        versions.append(location.version)
+        location.configure(ObservatoryLocation.get_configure_dict())
+        versions.append(location.version)
+        location.height = self.height_truth
+        versions.append(location.version)
+        self.assertEqual(versions, sorted(set(versions)))
+
+    def test_site_not_in_builtin_table(self):
+        site = mock.Mock(
+            latitude=self.latitude_truth,
+            longitude=self.longitude_truth,
+            height=self.height_truth,
+        )
+        with mock.patch.object(rs_utils, "Site", return_value=site) as site_class:
+            parameters = location_module._get_site_parameters("Gemini North")
+        site_class.assert_called_once_with(name="Gemini North")
+        self.assertEqual(parameters["latitude"], self.latitude_truth)
+        self.assertEqual(parameters["longitude"], self.longitude_truth)
+        self.assertEqual(parameters["height"], self.height_truth)
+
+    def test_from_site(self):
+        for name in ("LSST", "AuxTel"):
+            location = ObservatoryLocation.from_site(name)
+            site = rs_utils.Site(name=name)
+            self.assertAlmostEqual(location.latitude, site.latitude, places=10)
+            self.assertAlmostEqual(location.longitude, site.longitude, places=10)
+            self.assertEqual(location.height, site.height)
+            self.assertEqual(location.sin_latitude, math.sin(location.latitude_rad))
+            self.assertEqual(location.cos_latitude, math.cos(location.latitude_rad))
+        for name in ("TTS", "BTS"):
+            location = ObservatoryLocation.from_site(name)
+            self.assertEqual(
+                location.latitude_rad, location_module._get_site("LSST").latitude_rad
+            )
+        with self.assertRaises(ValueError):
+            ObservatoryLocation.from_site("Unknown Observatory")
+
+    def test_from_site_copy_on_write(self):
+        location1 = ObservatoryLocation.from_site("LSST")
+        location2 = ObservatoryLocation.from_site("LSST")
+        self.assertIsNot(location1, location2)
+        self.assertIs(location1._site, location2._site)
+        location1.reconfigure(
+            self.latitude_rad_truth, self.longitude_rad_truth, self.height_truth
+        )
+        location2.longitude_rad = self.longitude_rad_truth
+        self.assertEqual(location1.latitude, self.latitude_truth)
+        self.assertEqual(location1.sin_latitude, math.sin(self.latitude_rad_truth))
+        self.assertEqual(location2.longitude, self.longitude_truth)
+        lsst = ObservatoryLocation.from_site("LSST")
+        self.assertAlmostEqual(lsst.latitude, rs_utils.Site(name="LSST").latitude)
+        self.assertEqual(lsst.longitude, rs_utils.Site(name="LSST").longitude)
+
+    def test_latitude_trigonometry_after_changes(self):
+        location = ObservatoryLocation()
+        self.assertEqual(location.sin_latitude, 0.0)
+        self.assertEqual(location.cos_latitude, 1.0)
+        location.latitude_rad = self.latitude_rad_truth
+        self.assertEqual(location.sin_latitude, math.sin(self.latitude_rad_truth))
+        self.assertEqual(location.cos_latitude, math.cos(self.latitude_rad_truth))
+
+    def test_slots_pickle_and_copy(self):
+        location = ObservatoryLocation.from_site("LSST")
+        self.assertFalse(hasattr(location, "__dict__"))
+        restored = pickle.loads(pickle.dumps(location))
+        self.assertEqual(restored.latitude_rad, location.latitude_rad)
+        self.assertEqual(restored.longitude_rad, location.longitude_rad)
+        self.assertEqual(restored.height, location.height)
+        copied = location.copy()
+        self.assertEqual(copied.version, location.version)
+        copied.height = self.height_truth
+        self.assertEqual(location.height, 2650.0)
+        self.assertEqual(copied.latitude_rad, location.latitude_rad)
+
+    def test_site_hash(self):
+        location = ObservatoryLocation.from_site("LSST")
+        site_hash = location.site_hash
+        self.assertEqual(len(site_hash), 40)
+        # The hash only depends on the location information.
+        other = ObservatoryLocation()
+        other.for_lsst()
+        self.assertEqual(other.site_hash, site_hash)
+        other.configure(ObservatoryLocation.get_configure_dict())
+        self.assertEqual(other.site_hash, site_hash)
+        other.height += 1.0
+        self.assertNotEqual(other.site_hash, site_hash)
+        location.reconfigure(
+            self.latitude_rad_truth, self.longitude_rad_truth, self.height_truth
+        )
+        self.assertNotEqual(location.site_hash, site_hash)
+        self.assertNotEqual(
+            ObservatoryLocation.from_site("AuxTel").site_hash, site_hash
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
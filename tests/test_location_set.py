@@ -0,0 +1,120 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import math
+import unittest
+from unittest import mock
+
+import numpy as np
+import palpy
+from lsst.ts.dateloc import DateProfile, ObservatoryLocation, ObservatoryLocationSet
+
+"""Set timestamp as 2022-01-01 0h UTC"""
+LSST_START_TIMESTAMP = 1640995200.0
+
+
+class ObservatoryLocationSetTest(unittest.TestCase):
+    def setUp(self):
+        self.locations = [
+            ObservatoryLocation.from_site("LSST"),
+            # Gemini North
+            ObservatoryLocation(
+                math.radians(19.82396), math.radians(-155.46984), 4213.0
+            ),
+            # Siding Spring
+            ObservatoryLocation(
+                math.radians(-31.27333), math.radians(149.06119), 1165.0
+            ),
+        ]
+        self.location_set = ObservatoryLocationSet.from_locations(self.locations)
+        self.dp = DateProfile(LSST_START_TIMESTAMP, self.locations[0])
+
+    def test_arrays(self):
+        self.assertEqual(len(self.location_set), 3)
+        for index, location in enumerate(self.locations):
+            self.assertEqual(
+                self.location_set.latitude_rad[index], location.latitude_rad
+            )
+            self.assertEqual(
+                self.location_set.longitude_rad[index], location.longitude_rad
+            )
+            self.assertEqual(self.location_set.height[index], location.height)
+            self.assertEqual(
+                self.location_set.sin_latitude[index], location.sin_latitude
+            )
+            self.assertEqual(
+                self.location_set.cos_latitude[index], location.cos_latitude
+            )
+            self.assertEqual(self.location_set.utc_offset[index], location.utc_offset)
+        with self.assertRaises(ValueError):
+            self.location_set.longitude_rad[0] = 0.0
+        with self.assertRaises(AttributeError):
+            self.location_set.longitude_rad = np.zeros(3)
+
+    def test_does_not_share_input(self):
+        longitude_rad = np.array([0.1, 0.2])
+        location_set = ObservatoryLocationSet(0.0, longitude_rad, 100.0)
+        longitude_rad[0] = 0.5
+        self.assertEqual(location_set.longitude_rad[0], 0.1)
+        np.testing.assert_array_equal(location_set.height, [100.0, 100.0])
+
+    def test_locations(self):
+        for location, truth in zip(self.location_set, self.locations):
+            self.assertEqual(location.latitude_rad, truth.latitude_rad)
+            self.assertEqual(location.longitude_rad, truth.longitude_rad)
+            self.assertEqual(location.height, truth.height)
+
+    def test_from_sites(self):
+        location_set = ObservatoryLocationSet.from_sites(["LSST", "AuxTel"])
+        self.assertEqual(
+            location_set.longitude_rad[1],
+            ObservatoryLocation.from_site("AuxTel").longitude_rad,
+        )
+        self.assertEqual(len(ObservatoryLocationSet.from_locations([])), 0)
+
+    def test_compute_sites(self):
+        timestamps = LSST_START_TIMESTAMP + np.arange(0.0, 86400.0, 600.0)
+        timestamps[1::7] += 0.25
+        with mock.patch.object(
+            palpy, "gmstVector", wraps=palpy.gmstVector
+        ) as gmst_vector:
+            mjd, lst_rad = self.dp.compute_sites(self.location_set, timestamps)
+            self.assertEqual(gmst_vector.call_count, 1)
+        self.assertEqual(mjd.shape, timestamps.shape)
+        self.assertEqual(lst_rad.shape, (3,) + timestamps.shape)
+        self.assertEqual(self.dp.timestamp, LSST_START_TIMESTAMP)
+        for location, site_lst_rad in zip(self.locations, lst_rad):
+            self.dp.location = location
+            mjd_truth, lst_truth = self.dp.compute_many(timestamps)
+            np.testing.assert_array_equal(mjd, mjd_truth)
+            np.testing.assert_array_equal(site_lst_rad, lst_truth)
+
+    def test_compute_sites_internal_timestamp(self):
+        self.dp.update(LSST_START_TIMESTAMP + 3600.0)
+        mjd, lst_rad = self.dp.compute_sites(self.location_set)
+        self.assertEqual(mjd, self.dp.mjd)
+        self.assertEqual(lst_rad.shape, (3,))
+        for location, site_lst_rad in zip(self.locations, lst_rad):
+            self.dp.location = location
+            self.assertEqual(site_lst_rad, self.dp.lst_rad)
+
+
+if __name__ == "__main__":
+    unittest.main()
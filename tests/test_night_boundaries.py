@@ -0,0 +1,137 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import math
+import unittest
+
+import numpy as np
+import palpy
+from lsst.ts.dateloc import (
+    DateProfile,
+    NightBoundaries,
+    NightEvents,
+    ObservatoryLocation,
+    night_midnight,
+    sun_ra_dec,
+)
+
+"""Set timestamp as 2022-01-01 0h UTC"""
+LSST_START_TIMESTAMP = 1640995200.0
+
+
+class NightBoundariesTest(unittest.TestCase):
+    def setUp(self):
+        self.lsst_site = ObservatoryLocation.from_site("LSST")
+        self.dp = DateProfile(LSST_START_TIMESTAMP, self.lsst_site)
+        self.night_boundaries = NightBoundaries(self.lsst_site, cache_size=4)
+
+    def palpy_sun_altitude(self, timestamp):
+        self.dp.update(timestamp)
+        ra, dec, _ = palpy.rdplan(
+            self.dp.mjd, 0, self.lsst_site.longitude_rad, self.lsst_site.latitude_rad
+        )
+        _, altitude = palpy.de2h(self.dp.lst_rad - ra, dec, self.lsst_site.latitude_rad)
+        return math.degrees(altitude)
+
+    def test_sun_position(self):
+        mjd = 59580.0 + np.linspace(0.0, 3650.0, 50)
+        ra, dec = sun_ra_dec(mjd)
+        for i, value in enumerate(mjd):
+            ra_truth, dec_truth, _ = palpy.rdplan(value, 0, 0.0, 0.0)
+            self.assertAlmostEqual(
+                palpy.dsep(ra[i], dec[i], ra_truth, dec_truth), 0.0, delta=2e-4
+            )
+
+    def test_event_altitudes(self):
+        midnights = LSST_START_TIMESTAMP + 86400.0 * np.arange(0, 3650, 73)
+        events = self.night_boundaries.compute_many(midnights)
+        self.assertEqual(events.sunset.shape, midnights.shape)
+        for name, altitude in zip(
+            NightEvents._fields[2:], NightBoundaries.EVENT_ALTITUDES
+        ):
+            for timestamp in getattr(events, name):
+                self.assertAlmostEqual(
+                    self.palpy_sun_altitude(timestamp), altitude, delta=0.02
+                )
+        times = np.array(events[2:])
+        self.assertTrue(np.all(np.diff(times, axis=0) > 0.0))
+        self.assertTrue(np.all(times[0] > events.local_midnight - 43200.0))
+        self.assertTrue(np.all(times[-1] < events.local_midnight + 43200.0))
+
+    def test_night_of_date_profile(self):
+        self.dp.update(LSST_START_TIMESTAMP + 3.0 * 3600.0)
+        events = self.night_boundaries.for_date_profile(self.dp)
+        self.assertEqual(events.midnight, LSST_START_TIMESTAMP)
+        # The Chilean night of 2021-12-31 covers 2022-01-01 3h UTC.
+        self.assertLess(events.sunset, self.dp.timestamp)
+        self.assertGreater(events.sunrise, self.dp.timestamp)
+        self.assertGreaterEqual(events.local_midnight, LSST_START_TIMESTAMP)
+        self.assertLess(events.local_midnight, self.dp.next_midnight_timestamp())
+
+    def test_night_of_evening(self):
+        # 2022-06-21 23:30 UTC, the evening before 00:00 UTC in Chile.
+        self.dp.update(1655854200.0)
+        events = self.night_boundaries.for_date_profile(self.dp)
+        self.assertEqual(events.midnight, self.dp.next_midnight_timestamp())
+        self.assertEqual(events.local_midnight, self.dp.local_midnight_timestamp())
+        self.assertLess(events.sun_n18_setting, self.dp.timestamp)
+        self.assertGreater(events.sunrise, self.dp.timestamp)
+
+    def test_night_midnight(self):
+        utc_offset = self.lsst_site.utc_offset
+        timestamps = LSST_START_TIMESTAMP + 3600.0 * np.arange(-12, 36)
+        midnights = night_midnight(timestamps, utc_offset)
+        local_midnights = self.night_boundaries.local_midnight(midnights)
+        self.assertTrue(np.all(np.abs(timestamps - local_midnights) <= 43200.0))
+        self.assertEqual(night_midnight(timestamps[0], utc_offset), midnights[0])
+
+    def test_cache(self):
+        events = self.night_boundaries(LSST_START_TIMESTAMP)
+        self.assertIs(self.night_boundaries(LSST_START_TIMESTAMP), events)
+        for day in range(1, 5):
+            self.night_boundaries(LSST_START_TIMESTAMP + day * 86400.0)
+        self.assertEqual(len(self.night_boundaries._cache), 4)
+        self.assertIsNot(self.night_boundaries(LSST_START_TIMESTAMP), events)
+        self.assertEqual(self.night_boundaries(LSST_START_TIMESTAMP), events)
+
+    def test_location_change(self):
+        events = self.night_boundaries(LSST_START_TIMESTAMP)
+        self.lsst_site.longitude_rad += math.radians(15.0)
+        shifted = self.night_boundaries(LSST_START_TIMESTAMP)
+        self.assertAlmostEqual(shifted.sunset, events.sunset - 3600.0, delta=120.0)
+
+    def test_location_replaced(self):
+        self.night_boundaries(LSST_START_TIMESTAMP)
+        location = ObservatoryLocation(0.0, 0.0, 0.0)
+        self.night_boundaries.location = location
+        self.assertEqual(
+            self.night_boundaries(LSST_START_TIMESTAMP),
+            NightBoundaries(location).compute_many(LSST_START_TIMESTAMP),
+        )
+
+    def test_polar_summer(self):
+        location = ObservatoryLocation(math.radians(-80.0), 0.0, 0.0)
+        events = NightBoundaries(location)(LSST_START_TIMESTAMP)
+        self.assertTrue(math.isnan(events.sunset))
+        self.assertTrue(math.isnan(events.sun_n18_rising))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+from lsst.ts.dateloc import NightBoundaries, NightCache, ObservatoryLocation
+
+"""Set timestamp as 2022-01-01 0h UTC"""
+LSST_START_TIMESTAMP = 1640995200.0
+"""Night of 2022-01-01"""
+LSST_START_NIGHT = 18993
+
+
+class NightCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.lsst_site = ObservatoryLocation.from_site("LSST")
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.filename = os.path.join(temporary_directory.name, "nights.sqlite3")
+        self.cache = NightCache(self.filename)
+        self.addCleanup(self.cache.close)
+        self.nights = LSST_START_NIGHT + np.arange(10)
+
+    def test_get_put(self):
+        values, found = self.cache.get(self.lsst_site, self.nights, "value")
+        self.assertFalse(found.any())
+        self.assertTrue(np.isnan(values).all())
+        self.cache.put(
+            self.lsst_site, self.nights[::2], "value", self.nights[::2] * 2.0
+        )
+        self.cache.put(self.lsst_site, self.nights[1:2], "value", np.nan)
+        values, found = self.cache.get(self.lsst_site, self.nights, "value")
+        np.testing.assert_array_equal(found, [True, True] + [True, False] * 4)
+        np.testing.assert_array_equal(values[::2], self.nights[::2] * 2.0)
+        self.assertTrue(np.isnan(values[1]))
+        # Other quantities and locations are separate.
+        _, found = self.cache.get(self.lsst_site, self.nights, "other")
+        self.assertFalse(found.any())
+        location = self.lsst_site.copy()
+        location.height += 1.0
+        _, found = self.cache.get(location, self.nights, "value")
+        self.assertFalse(found.any())
+
+    def test_persistence(self):
+        self.cache.put(self.lsst_site, self.nights, "value", 1.0)
+        self.cache.close()
+        with NightCache(self.filename) as cache:
+            self.assertEqual(len(cache), self.nights.size)
+            values, found = cache.get(
+                ObservatoryLocation.from_site("LSST"), self.nights, "value"
+            )
+        self.assertTrue(found.all())
+        np.testing.assert_array_equal(values, 1.0)
+        self.cache = NightCache(self.filename)
+
+    def test_eviction(self):
+        self.cache.max_entries = 15
+        self.cache.put(self.lsst_site, self.nights, "first", 1.0)
+        self.cache.put(self.lsst_site, self.nights, "second", 2.0)
+        self.assertEqual(len(self.cache), 15)
+        # The least recently used values are removed.
+        _, found = self.cache.get(self.lsst_site, self.nights, "first")
+        self.assertEqual(found.sum(), 5)
+        _, found = self.cache.get(self.lsst_site, self.nights, "second")
+        self.assertTrue(found.all())
+
+    def test_eviction_of_unused_nights(self):
+        self.cache.max_entries = 10
+        self.cache.put(self.lsst_site, self.nights, "value", 1.0)
+        # Only the requested nights are marked as used, not the ones between.
+        self.cache.get(self.lsst_site, self.nights[[0, 9]], "value")
+        self.cache.put(self.lsst_site, self.nights[:2], "other", 2.0)
+        _, found = self.cache.get(self.lsst_site, self.nights, "value")
+        self.assertTrue(found[[0, 9]].all())
+        self.assertEqual(found.sum(), 8)
+
+    def test_get_or_compute(self):
+        function = mock.Mock(side_effect=lambda nights: nights * 3.0)
+        values = self.cache.get_or_compute(
+            self.lsst_site, self.nights[:5], "value", function
+        )
+        np.testing.assert_array_equal(values, self.nights[:5] * 3.0)
+        values = self.cache.get_or_compute(
+            self.lsst_site, self.nights, "value", function
+        )
+        np.testing.assert_array_equal(values, self.nights * 3.0)
+        self.assertEqual(function.call_count, 2)
+        np.testing.assert_array_equal(function.call_args[0][0], self.nights[5:])
+
+    def test_night_events(self):
+        night_boundaries = NightBoundaries(self.lsst_site)
+        midnights = self.nights * 86400.0
+        expected = night_boundaries.compute_many(midnights)
+        events = self.cache.night_events(night_boundaries, midnights)
+        for name in expected._fields:
+            np.testing.assert_array_equal(
+                getattr(events, name), getattr(expected, name)
+            )
+        with mock.patch.object(night_boundaries, "compute_many") as compute_many:
+            events = self.cache.night_events(night_boundaries, midnights[2:5])
+        compute_many.assert_not_called()
+        np.testing.assert_array_equal(events.sunset, expected.sunset[2:5])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import math
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from lsst.ts.dateloc import (
+    BodyEphemeris,
+    DateProfile,
+    NightBoundaries,
+    NightEphemerisStore,
+    ObservatoryLocation,
+)
+
+"""Set timestamp as 2022-01-01 0h UTC"""
+LSST_START_TIMESTAMP = 1640995200.0
+"""Number of nights in the test store"""
+NUM_NIGHTS = 40
+
+
+class NightEphemerisStoreTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.lsst_site = ObservatoryLocation.from_site("LSST")
+        cls.store = NightEphemerisStore(
+            cls.lsst_site,
+            LSST_START_TIMESTAMP + 3600.0,
+            LSST_START_TIMESTAMP + (NUM_NIGHTS - 1) * 86400.0,
+            chunk_size=16,
+        )
+
+    def setUp(self):
+        self.dp = DateProfile(LSST_START_TIMESTAMP, self.lsst_site)
+        self.ephemeris = BodyEphemeris(self.dp)
+
+    def test_nights(self):
+        self.assertEqual(len(self.store), NUM_NIGHTS)
+        self.assertEqual(self.store.first_night, 18993)
+        midnights = LSST_START_TIMESTAMP + np.arange(NUM_NIGHTS) * 86400.0
+        np.testing.assert_array_equal(self.store.records["midnight"], midnights)
+        events = NightBoundaries(self.lsst_site).compute_many(midnights)
+        for name, values in zip(events._fields, events):
+            np.testing.assert_array_equal(self.store.records[name], values)
+
+    def test_lookup(self):
+        self.dp.update(LSST_START_TIMESTAMP + 10.5 * 86400.0)
+        record = self.store.for_date_profile(self.dp)
+        self.assertEqual(record["midnight"], self.dp.midnight_timestamp())
+        self.assertEqual(self.store.for_midnight(self.dp.midnight_timestamp()), record)
+        self.assertEqual(self.store.night(18993 + 10), record)
+        with self.assertRaises(ValueError):
+            self.store.night(18992)
+        with self.assertRaises(ValueError):
+            self.store.for_midnight(LSST_START_TIMESTAMP + NUM_NIGHTS * 86400.0)
+
+    def test_lookup_evening(self):
+        # 2022-06-21 23:30 UTC, the evening before 00:00 UTC in Chile.
+        timestamp = 1655854200.0
+        store = NightEphemerisStore(
+            self.lsst_site, timestamp - 86400.0, timestamp + 86400.0
+        )
+        self.dp.update(timestamp)
+        record = store.for_date_profile(self.dp)
+        self.assertEqual(record["midnight"], self.dp.next_midnight_timestamp())
+        self.assertEqual(record["local_midnight"], self.dp.local_midnight_timestamp())
+        self.assertLess(record["sun_n18_setting"], timestamp)
+        self.assertGreater(record["sunrise"], timestamp)
+
+    def test_sidereal_times(self):
+        record = self.store.night(18995)
+        self.dp.update(record["sun_n12_setting"])
+        self.assertEqual(record["lst_dusk"], self.dp.lst_rad)
+        self.dp.update(record["sun_n12_rising"])
+        self.assertEqual(record["lst_dawn"], self.dp.lst_rad)
+
+    def test_moon(self):
+        horizon = math.radians(NightEphemerisStore.MOON_HORIZON)
+        records = self.store.records
+        self.assertGreater(np.isfinite(records["moonrise"]).sum(), NUM_NIGHTS - 3)
+        self.assertGreater(np.isfinite(records["moonset"]).sum(), NUM_NIGHTS - 3)
+        for record in records:
+            for name, direction in (("moonrise", 1.0), ("moonset", -1.0)):
+                if np.isnan(record[name]):
+                    continue
+                self.assertLess(abs(record[name] - record["local_midnight"]), 43200.0)
+                altitude = self.ephemeris.compute_many(
+                    record[name] + np.array([-60.0, 0.0, 60.0])
+                ).moon_alt
+                self.assertAlmostEqual(altitude[1], horizon, delta=1e-5)
+                self.assertGreater(direction * (altitude[2] - altitude[0]), 0.0)
+            self.dp.update(record["local_midnight"])
+            self.assertEqual(record["moon_phase"], self.ephemeris.positions.moon_phase)
+        # Full Moon of 2022-01-17.
+        self.assertGreater(self.store.night(18993 + 17)["moon_phase"], 0.99)
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "nights.npy")
+            self.store.save(filename)
+            store = NightEphemerisStore.load(filename, self.lsst_site)
+            self.assertIsInstance(store.records, np.memmap)
+            self.assertEqual(store.first_night, self.store.first_night)
+            for name in NightEphemerisStore.DTYPE.names:
+                np.testing.assert_array_equal(
+                    store.records[name], self.store.records[name]
+                )
+            self.dp.update(LSST_START_TIMESTAMP + 5.5 * 86400.0)
+            self.assertEqual(
+                store.for_date_profile(self.dp), self.store.for_date_profile(self.dp)
+            )
+            with self.assertRaises(ValueError):
+                NightEphemerisStore.load(filename, ObservatoryLocation())
+            del store
+
+            np.save(filename, np.zeros(3))
+            with self.assertRaises(ValueError):
+                NightEphemerisStore.load(filename, self.lsst_site)
+
+    def test_empty(self):
+        store = NightEphemerisStore(
+            self.lsst_site, LSST_START_TIMESTAMP, LSST_START_TIMESTAMP - 86400.0
+        )
+        self.assertEqual(len(store), 0)
+        with self.assertRaises(ValueError):
+            store.night(18993)
+
+
+if __name__ == "__main__":
+    unittest.main()
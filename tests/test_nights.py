@@ -0,0 +1,96 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+from lsst.ts.dateloc import (
+    DateProfile,
+    ObservatoryLocation,
+    dayobs,
+    local_midnight_timestamp,
+    midnight_timestamp,
+    night_index,
+)
+
+"""Set timestamp as 2022-01-01 0h UTC"""
+LSST_START_TIMESTAMP = 1640995200.0
+
+
+class NightsTest(unittest.TestCase):
+    def setUp(self):
+        self.lsst_site = ObservatoryLocation.from_site("LSST")
+        self.dp = DateProfile(LSST_START_TIMESTAMP, self.lsst_site)
+        rng = np.random.default_rng(10)
+        self.timestamps = LSST_START_TIMESTAMP + rng.uniform(-3e8, 3e8, 2000)
+
+    def test_utc_offset(self):
+        self.assertAlmostEqual(
+            self.lsst_site.utc_offset, -70.74941 / 15.0 * 3600.0, places=6
+        )
+
+    def test_chilean_night(self):
+        # 2022-01-01 3h UTC is still the night of 2021-12-31 in Chile.
+        self.dp.update(LSST_START_TIMESTAMP + 3.0 * 3600.0)
+        self.assertEqual(self.dp.dayobs(), 20211231)
+        self.assertEqual(self.dp.night_index(), 18992)
+        local_midnight = self.dp.local_midnight_timestamp()
+        self.assertAlmostEqual(
+            local_midnight, LSST_START_TIMESTAMP - self.lsst_site.utc_offset
+        )
+        # The evening of 2022-01-01 is the next night.
+        self.dp.update(LSST_START_TIMESTAMP + 23.0 * 3600.0)
+        self.assertEqual(self.dp.dayobs(), 20220101)
+        self.assertEqual(self.dp.local_midnight_timestamp(), local_midnight + 86400.0)
+
+    def test_rubin_dayobs(self):
+        self.assertEqual(
+            dayobs(LSST_START_TIMESTAMP + 12.0 * 3600.0 - 1.0, 0.0), 20211231
+        )
+        self.assertEqual(dayobs(LSST_START_TIMESTAMP + 12.0 * 3600.0, 0.0), 20220101)
+
+    def test_arrays(self):
+        utc_offset = -4.0 * 3600.0
+        indices = night_index(self.timestamps, utc_offset)
+        dates = dayobs(self.timestamps, utc_offset)
+        midnights = midnight_timestamp(self.timestamps)
+        local_midnights = local_midnight_timestamp(self.timestamps, utc_offset)
+        for i, timestamp in enumerate(self.timestamps):
+            evening = datetime.fromtimestamp(timestamp, timezone.utc) + timedelta(
+                seconds=utc_offset - 43200.0
+            )
+            self.assertEqual(int(evening.strftime("%Y%m%d")), dates[i])
+            self.dp.update(timestamp)
+            self.assertEqual(self.dp.midnight_timestamp(), midnights[i])
+            self.assertEqual(self.dp.night_index(utc_offset), indices[i])
+            self.assertEqual(
+                self.dp.local_midnight_timestamp(utc_offset), local_midnights[i]
+            )
+            self.assertLess(abs(timestamp - local_midnights[i]), 43200.0)
+
+    def test_scalar_types(self):
+        self.assertIsInstance(night_index(LSST_START_TIMESTAMP, 0.0), int)
+        self.assertIsInstance(dayobs(LSST_START_TIMESTAMP, 0.0), int)
+        self.assertIsInstance(midnight_timestamp(LSST_START_TIMESTAMP), float)
+
+
+if __name__ == "__main__":
+    unittest.main()
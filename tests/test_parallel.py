@@ -0,0 +1,85 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from lsst.ts.dateloc import DateProfile, ObservatoryLocation, compute_range_parallel
+
+"""Set timestamp as 2022-01-01 0h UTC"""
+LSST_START_TIMESTAMP = 1640995200.0
+
+
+class ComputeRangeParallelTest(unittest.TestCase):
+    def setUp(self):
+        self.lsst_site = ObservatoryLocation.from_site("LSST")
+        self.dp = DateProfile(LSST_START_TIMESTAMP, self.lsst_site)
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.filename = os.path.join(temporary_directory.name, "range.npy")
+        self.stop = LSST_START_TIMESTAMP + 86400.0
+        self.timestamps = np.arange(LSST_START_TIMESTAMP, self.stop, 7.5)
+
+    def test_workers(self):
+        mjd, lst_rad = compute_range_parallel(
+            self.dp,
+            LSST_START_TIMESTAMP,
+            self.stop,
+            7.5,
+            self.filename,
+            max_workers=2,
+            chunk_size=1000,
+        )
+        expected_mjd, expected_lst_rad = self.dp.compute_many(self.timestamps)
+        np.testing.assert_array_equal(mjd, expected_mjd)
+        np.testing.assert_array_equal(lst_rad, expected_lst_rad)
+        self.assertEqual(self.dp.timestamp, LSST_START_TIMESTAMP)
+        # The results stay on disk, in a standard .npy file.
+        stored = np.load(self.filename)
+        self.assertEqual(stored.shape, (2, self.timestamps.size))
+        np.testing.assert_array_equal(stored[1], expected_lst_rad)
+
+    def test_single_worker(self):
+        self.dp.legacy_mjd = True
+        mjd, lst_rad = compute_range_parallel(
+            self.dp,
+            LSST_START_TIMESTAMP,
+            self.stop,
+            7.5,
+            self.filename,
+            max_workers=1,
+            chunk_size=1000,
+        )
+        expected_mjd, expected_lst_rad = self.dp.compute_many(self.timestamps)
+        np.testing.assert_array_equal(mjd, expected_mjd)
+        np.testing.assert_array_equal(lst_rad, expected_lst_rad)
+
+    def test_empty(self):
+        mjd, lst_rad = compute_range_parallel(
+            self.dp, self.stop, LSST_START_TIMESTAMP, 1.0, self.filename
+        )
+        self.assertEqual(mjd.size, 0)
+        self.assertEqual(lst_rad.size, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
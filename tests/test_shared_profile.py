@@ -0,0 +1,85 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import threading
+import unittest
+
+from lsst.ts.dateloc import DateProfile, ObservatoryLocation, SharedDateProfile
+
+"""Set timestamp as 2022-01-01 0h UTC"""
+LSST_START_TIMESTAMP = 1640995200.0
+
+
+class SharedDateProfileTest(unittest.TestCase):
+    def setUp(self):
+        self.lsst_site = ObservatoryLocation.from_site("LSST")
+        self.shared = SharedDateProfile(LSST_START_TIMESTAMP, self.lsst_site)
+        self.dp = DateProfile(LSST_START_TIMESTAMP, self.lsst_site)
+
+    def test_update(self):
+        self.assertIs(self.shared.location, self.lsst_site)
+        self.assertEqual(self.shared.snapshot, self.dp.snapshot())
+        snapshot = self.shared.update(LSST_START_TIMESTAMP + 3600.0)
+        self.assertIs(self.shared.snapshot, snapshot)
+        self.dp.update(LSST_START_TIMESTAMP + 3600.0)
+        self.assertEqual(snapshot, self.dp.snapshot())
+        self.assertEqual(snapshot.midnight, LSST_START_TIMESTAMP)
+        self.assertIs(self.shared(LSST_START_TIMESTAMP), self.shared.snapshot)
+        self.assertEqual(self.shared.snapshot.timestamp, LSST_START_TIMESTAMP)
+        self.assertEqual(
+            self.shared.compute_many(LSST_START_TIMESTAMP + 3600.0),
+            (snapshot.mjd, snapshot.lst_rad),
+        )
+
+    def test_concurrent_readers(self):
+        # Timestamps crossing UTC and local midnights.
+        timestamps = [LSST_START_TIMESTAMP + 997.0 * i for i in range(200)]
+        truth = {}
+        for timestamp in timestamps:
+            self.dp.update(timestamp)
+            truth[timestamp] = self.dp.snapshot()
+        stop = threading.Event()
+        errors = []
+
+        def update():
+            while not stop.is_set():
+                for timestamp in timestamps:
+                    self.shared.update(timestamp)
+
+        def read():
+            for _ in range(20000):
+                snapshot = self.shared.snapshot
+                if snapshot != truth[snapshot.timestamp]:
+                    errors.append(snapshot)
+
+        writers = [threading.Thread(target=update) for _ in range(2)]
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for thread in writers + readers:
+            thread.start()
+        for thread in readers:
+            thread.join()
+        stop.set()
+        for thread in writers:
+            thread.join()
+        self.assertEqual(errors, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
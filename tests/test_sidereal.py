@@ -0,0 +1,115 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import math
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from lsst.ts.dateloc import DateProfile, ObservatoryLocation, SiderealTimeTable
+
+"""Set timestamp as 2022-01-01 0h UTC"""
+LSST_START_TIMESTAMP = 1640995200.0
+"""Ten years in seconds"""
+TEN_YEARS = 3653.0 * 86400.0
+
+
+def angle_difference(angle1, angle2):
+    return (angle1 - angle2 + math.pi) % (2.0 * math.pi) - math.pi
+
+
+class SiderealTimeTableTest(unittest.TestCase):
+    def setUp(self):
+        self.lsst_site = ObservatoryLocation()
+        self.lsst_site.for_lsst()
+        self.dp = DateProfile(LSST_START_TIMESTAMP, self.lsst_site)
+        self.table = SiderealTimeTable(
+            self.lsst_site,
+            LSST_START_TIMESTAMP,
+            LSST_START_TIMESTAMP + TEN_YEARS,
+            step=86400.0,
+        )
+        rng = np.random.default_rng(42)
+        self.timestamps = LSST_START_TIMESTAMP + rng.uniform(0.0, TEN_YEARS, 10000)
+
+    def test_accuracy(self):
+        _, lst_truth = self.dp.compute_many(self.timestamps)
+        self.assertLess(self.table.error_bound, 1e-9)
+        for method in ("linear", "cubic"):
+            lst_rad = self.table.lst_rad(self.timestamps, method=method)
+            error = np.abs(angle_difference(lst_rad, lst_truth))
+            self.assertLess(error.max(), self.table.error_bound)
+
+    def test_scalar_query(self):
+        self.dp.update(LSST_START_TIMESTAMP + 3600.5)
+        lst_rad = self.table.lst_rad(self.dp.timestamp)
+        self.assertIsInstance(lst_rad, float)
+        self.assertAlmostEqual(lst_rad, self.dp.lst_rad, delta=1e-9)
+        self.assertAlmostEqual(
+            self.table.gmst_rad(self.dp.timestamp), self.dp.gmst_rad, delta=1e-9
+        )
+
+    def test_covers_requested_span(self):
+        self.assertGreaterEqual(
+            self.table.stop_timestamp, LSST_START_TIMESTAMP + TEN_YEARS
+        )
+        self.table.lst_rad(LSST_START_TIMESTAMP + TEN_YEARS)
+        with self.assertRaises(ValueError):
+            self.table.lst_rad(LSST_START_TIMESTAMP - 1.0)
+        with self.assertRaises(ValueError):
+            self.table.lst_rad(self.table.stop_timestamp + 1.0)
+        with self.assertRaises(ValueError):
+            self.table.lst_rad(LSST_START_TIMESTAMP, method="spline")
+
+    def test_follows_location(self):
+        location = ObservatoryLocation()
+        table = SiderealTimeTable(
+            location, LSST_START_TIMESTAMP, LSST_START_TIMESTAMP + 86400.0
+        )
+        location.reconfigure(0.0, 1.0, 0.0)
+        self.assertAlmostEqual(
+            angle_difference(
+                table.lst_rad(LSST_START_TIMESTAMP),
+                table.gmst_rad(LSST_START_TIMESTAMP),
+            ),
+            1.0,
+        )
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "sidereal.npy")
+            self.table.save(filename)
+            table = SiderealTimeTable.load(filename, self.lsst_site)
+            self.assertIsInstance(table._data, np.memmap)
+            self.assertEqual(table.start_timestamp, self.table.start_timestamp)
+            self.assertEqual(table.step, self.table.step)
+            np.testing.assert_array_equal(
+                table.lst_rad(self.timestamps), self.table.lst_rad(self.timestamps)
+            )
+            del table
+
+            np.save(filename, np.zeros(10))
+            with self.assertRaises(ValueError):
+                SiderealTimeTable.load(filename, self.lsst_site)
+
+
+if __name__ == "__main__":
+    unittest.main()
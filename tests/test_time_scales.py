@@ -0,0 +1,130 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import palpy
+from lsst.ts.dateloc import (
+    SIDEREAL_RATE,
+    DateProfile,
+    Dut1Table,
+    ObservatoryLocation,
+    tai_utc,
+    utc_to_tai,
+    utc_to_tt,
+)
+from lsst.ts.dateloc.time_scales import LEAP_SECONDS
+
+"""Set timestamp as 2022-01-01 0h UTC"""
+LSST_START_TIMESTAMP = 1640995200.0
+"""Timestamp of the 2016-12-31 leap second (2017-01-01 0h UTC)"""
+LEAP_SECOND_TIMESTAMP = 1483228800.0
+
+"""Lines of the IERS finals2000A.all file around the last leap second"""
+FINALS_LINES = """\
+161229 57751.00 I  0.033525 0.000028  0.322669 0.000044  I-0.4072710 0.0000090
+161230 57752.00 I  0.031917 0.000028  0.321961 0.000045  I-0.4081130 0.0000094
+161231 57753.00 I  0.030302 0.000027  0.321364 0.000045  I-0.4089470 0.0000110
+17 1 1 57754.00 I  0.028744 0.000026  0.320952 0.000046  I 0.5922280 0.0000136
+17 1 2 57755.00 I  0.027244 0.000026  0.320562 0.000047  I 0.5913560 0.0000148
+17 1 3 57756.00 P  0.025735 0.000026  0.320133 0.000048
+"""
+
+
+class TimeScalesTest(unittest.TestCase):
+    def setUp(self):
+        self.lsst_site = ObservatoryLocation.from_site("LSST")
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.filename = os.path.join(temporary_directory.name, "finals2000A.all")
+        with open(self.filename, "w") as finals_file:
+            finals_file.write(FINALS_LINES)
+
+    def test_leap_seconds(self):
+        mjd = np.array([mjd for (mjd, _) in LEAP_SECONDS], dtype=float)
+        timestamps = (mjd - DateProfile.MJD_UNIX_EPOCH) * DateProfile.SECONDS_IN_DAY
+        # palpy also covers the dates before 1972, which are not checked.
+        for offset in (0.0, -1.0, 86400.0 * 10.0):
+            expected = [palpy.dat(value) for value in mjd[1:] + offset / 86400.0]
+            np.testing.assert_array_equal(tai_utc(timestamps[1:] + offset), expected)
+        self.assertEqual(tai_utc(LSST_START_TIMESTAMP), 37.0)
+        self.assertEqual(tai_utc(0.0), 10.0)
+
+    def test_utc_to_tai_tt(self):
+        self.assertEqual(utc_to_tai(LSST_START_TIMESTAMP), LSST_START_TIMESTAMP + 37.0)
+        self.assertAlmostEqual(
+            utc_to_tt(LSST_START_TIMESTAMP), LSST_START_TIMESTAMP + 69.184
+        )
+        timestamps = LEAP_SECOND_TIMESTAMP + np.array([-1.0, 0.0])
+        np.testing.assert_array_equal(
+            utc_to_tai(timestamps), timestamps + np.array([36.0, 37.0])
+        )
+
+    def test_dut1_table(self):
+        table = Dut1Table.from_finals(self.filename)
+        self.assertEqual(table.timestamps.size, 5)
+        self.assertAlmostEqual(table.ut1_utc(LEAP_SECOND_TIMESTAMP), 0.592228)
+        self.assertAlmostEqual(
+            table.ut1_utc(LEAP_SECOND_TIMESTAMP - 86400.0), -0.408947
+        )
+        # UT1 is continuous through the leap second.
+        ut1 = table.utc_to_ut1(LEAP_SECOND_TIMESTAMP + np.array([-43200.0, -1.0]))
+        ut1_tai_change = (0.592228 - 37.0) - (-0.408947 - 36.0)
+        self.assertAlmostEqual(
+            ut1[1] - ut1[0], 43199.0 * (1.0 + ut1_tai_change / 86400.0), places=6
+        )
+        self.assertAlmostEqual(
+            table.ut1_utc(LEAP_SECOND_TIMESTAMP + 43200.0), (0.592228 + 0.591356) / 2
+        )
+        # Outside of the table the last value is used.
+        self.assertAlmostEqual(table.ut1_utc(LSST_START_TIMESTAMP), 0.591356)
+
+    def test_empty_dut1_table(self):
+        with self.assertRaises(ValueError):
+            Dut1Table([], [])
+
+    def test_date_profile_ut1(self):
+        table = Dut1Table([59000.0, 60000.0], [-0.2, -0.2])
+        dp = DateProfile(LSST_START_TIMESTAMP, self.lsst_site)
+        dp_ut1 = DateProfile(LSST_START_TIMESTAMP, self.lsst_site, dut1_table=table)
+        self.assertEqual(dp_ut1.mjd, dp.mjd)
+        self.assertAlmostEqual(
+            dp_ut1.lst_rad - dp.lst_rad, -0.2 * SIDEREAL_RATE, delta=1e-10
+        )
+        timestamps = LSST_START_TIMESTAMP + np.arange(0.0, 86400.0, 600.0)
+        _, lst_rad = dp.compute_many(timestamps)
+        _, lst_ut1_rad = dp_ut1.compute_many(timestamps)
+        np.testing.assert_allclose(
+            lst_ut1_rad - lst_rad, -0.2 * SIDEREAL_RATE, rtol=0.0, atol=1e-10
+        )
+        (chunk,) = dp_ut1.iter_range(
+            timestamps[0], 86400.0 + timestamps[0], 600.0, 1000
+        )
+        np.testing.assert_allclose(chunk[2], lst_ut1_rad, rtol=0.0, atol=1e-9)
+        # Removing the table gives back the UTC based values.
+        dp_ut1.dut1_table = None
+        self.assertEqual(dp_ut1.lst_rad, dp.lst_rad)
+
+
+if __name__ == "__main__":
+    unittest.main()
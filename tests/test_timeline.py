@@ -0,0 +1,117 @@
+# This file is part of ts_dateloc.
+#
+# Developed for the Vera Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+import importlib.util
+import os
+import pathlib
+import tempfile
+import unittest
+
+import numpy as np
+from lsst.ts.dateloc import (
+    DateProfile,
+    ObservatoryLocation,
+    Timeline,
+    load_timeline,
+    local_midnight_timestamp,
+    midnight_timestamp,
+    night_index,
+    write_timeline,
+)
+
+"""Set timestamp as 2022-01-01 0h UTC"""
+LSST_START_TIMESTAMP = 1640995200.0
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+class TimelineTest(unittest.TestCase):
+    def setUp(self):
+        self.lsst_site = ObservatoryLocation.from_site("LSST")
+        self.dp = DateProfile(LSST_START_TIMESTAMP, self.lsst_site)
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.directory = temporary_directory.name
+        self.stop = LSST_START_TIMESTAMP + 3.0 * 86400.0
+        self.timestamps = np.arange(LSST_START_TIMESTAMP, self.stop, 90.0)
+
+    def check_timeline(self, timeline):
+        self.assertIsInstance(timeline, Timeline)
+        mjd, lst_rad = self.dp.compute_many(self.timestamps)
+        utc_offset = self.lsst_site.utc_offset
+        np.testing.assert_array_equal(timeline.timestamp, self.timestamps)
+        np.testing.assert_array_equal(timeline.mjd, mjd)
+        np.testing.assert_array_equal(timeline.lst_rad, lst_rad)
+        np.testing.assert_array_equal(
+            timeline.night_index, night_index(self.timestamps, utc_offset)
+        )
+        np.testing.assert_array_equal(
+            timeline.midnight, midnight_timestamp(self.timestamps)
+        )
+        np.testing.assert_array_equal(
+            timeline.local_midnight,
+            local_midnight_timestamp(self.timestamps, utc_offset),
+        )
+
+    def test_npz(self):
+        filename = os.path.join(self.directory, "timeline.npz")
+        write_timeline(
+            filename, self.dp, LSST_START_TIMESTAMP, self.stop, 90.0, chunk_size=1000
+        )
+        timeline = load_timeline(filename)
+        self.assertIsInstance(timeline.lst_rad, np.memmap)
+        self.check_timeline(timeline)
+        # The file is a standard .npz file.
+        with np.load(filename) as npz_file:
+            self.assertEqual(sorted(npz_file.files), sorted(Timeline._fields))
+            np.testing.assert_array_equal(npz_file["mjd"], timeline.mjd)
+
+    def test_path(self):
+        filename = pathlib.Path(self.directory) / "timeline.npz"
+        write_timeline(filename, self.dp, LSST_START_TIMESTAMP, self.stop, 90.0)
+        self.check_timeline(load_timeline(filename))
+        self.assertEqual(os.listdir(self.directory), ["timeline.npz"])
+
+    def test_npz_empty(self):
+        filename = os.path.join(self.directory, "timeline.npz")
+        write_timeline(filename, self.dp, self.stop, LSST_START_TIMESTAMP, 90.0)
+        timeline = load_timeline(filename)
+        self.assertEqual(timeline.timestamp.size, 0)
+        self.assertEqual(timeline.night_index.dtype, np.int64)
+
+    def test_compressed_npz(self):
+        filename = os.path.join(self.directory, "timeline.npz")
+        np.savez_compressed(
+            filename, **{name: self.timestamps for name in Timeline._fields}
+        )
+        with self.assertRaises(ValueError):
+            load_timeline(filename)
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed.")
+    def test_parquet(self):
+        filename = os.path.join(self.directory, "timeline.parquet")
+        write_timeline(
+            filename, self.dp, LSST_START_TIMESTAMP, self.stop, 90.0, chunk_size=1000
+        )
+        self.check_timeline(load_timeline(filename))
+
+
+if __name__ == "__main__":
+    unittest.main()